@@ -0,0 +1,166 @@
+"""Measures the memory held by installed mods and found updates on a large profile.
+
+Compares the Mod and Update records with the plain dicts they replaced (the whole
+modinfo.json of every mod, and updates holding the whole latest Mod DB release and a
+list of single-key changelog dicts), and the peak memory of evaluating every mod's
+releases with and without dropping releases older than the installed one.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory --mods 2000 --releases 100
+"""
+
+import gc
+import json
+import zipfile
+import logging
+import argparse
+import tempfile
+import tracemalloc
+
+from pathlib import Path
+from src.mod_index import find_mod_zips, get_mod_info_from_zip
+from src.records import Mod
+from src.releases import ReleaseIndex
+from src.utils import fix_json_string, parse_version
+from benchmarks.bench_releases import legacy_find_update
+from benchmarks.synthetic import GAME_VERSIONS, make_profile
+
+
+def retained(build) -> tuple[object, int]:
+    """Returns what build returns and the bytes it still holds afterwards."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - before
+
+
+def peak(run) -> int:
+    """Returns the peak bytes allocated while run runs, above what was held before."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    run()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def legacy_mods_data(zip_paths: list[Path]) -> dict[str, dict]:
+    """Builds mods_data the way it was before Mod records: every modinfo.json field."""
+    mods_data = {}
+    for zip_path in zip_paths:
+        with zipfile.ZipFile(zip_path) as zip_ref:
+            mod_info = json.loads(
+                fix_json_string(zip_ref.read("modinfo.json").decode())
+            )
+        mod_info = {k.lower(): v for k, v in mod_info.items()}
+        mod_info["path"] = zip_path
+        mods_data[mod_info["modid"]] = mod_info
+    return mods_data
+
+
+def record_mods_data(zip_paths: list[Path]) -> dict[str, Mod]:
+    mods_data = {}
+    for zip_path in zip_paths:
+        mod_info = get_mod_info_from_zip(zip_path)
+        mods_data[mod_info["modid"]] = Mod.from_mod_info(mod_info)
+    return mods_data
+
+
+def legacy_updates(bodies: dict[str, str], installed: dict[str, str]) -> list[dict]:
+    """Builds updates the way they were before Update records."""
+    updates = []
+    for mod_id, body in bodies.items():
+        mod_db_info = json.loads(body)
+        found = legacy_find_update(mod_db_info, installed[mod_id], GAME_VERSIONS[-1])
+        if found is not None:
+            latest_release, changelog = found
+            updates.append(
+                {
+                    "mod_id": mod_id,
+                    "name": mod_db_info["mod"]["name"],
+                    "current_version": installed[mod_id],
+                    "latest_version": latest_release["modversion"],
+                    "latest_release": latest_release,
+                    "changelog": changelog,
+                }
+            )
+    return updates
+
+
+def evaluate_all(bodies: dict[str, str], installed: dict[str, str], trim: bool) -> list:
+    """Finds every update like UpdaterCore.evaluate_mod, optionally without trimming."""
+    results = []
+    for mod_id, body in bodies.items():
+        current = parse_version(installed[mod_id])
+        index = ReleaseIndex(json.loads(body), current if trim else None)
+        results.append(index.find_update(current, GAME_VERSIONS[-1]))
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=2000, help="Number of mods")
+    parser.add_argument("--releases", type=int, default=100, help="Releases per mod")
+    parser.add_argument(
+        "--outdated", type=float, default=0.5, help="Fraction of outdated mods"
+    )
+    parser.add_argument(
+        "--changelog-chars", type=int, default=600, help="Length of each changelog"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        mods_path = Path(tmp) / "mods"
+        mods, _ = make_profile(
+            mods_path,
+            args.mods,
+            1,
+            args.releases,
+            args.outdated,
+            "http://127.0.0.1",
+            changelog_chars=args.changelog_chars,
+        )
+        # Mod DB responses as they arrive, and the installed version of every mod
+        bodies = {mod_id: json.dumps(mod) for mod_id, mod in mods.items()}
+        del mods
+        zip_paths = find_mod_zips(mods_path)
+
+        tracemalloc.start()
+        legacy_mods, legacy_mods_bytes = retained(lambda: legacy_mods_data(zip_paths))
+        installed = {m: info["version"] for m, info in legacy_mods.items()}
+        del legacy_mods
+        _, mods_bytes = retained(lambda: record_mods_data(zip_paths))
+
+        updates, legacy_updates_bytes = retained(
+            lambda: legacy_updates(bodies, installed)
+        )
+        update_count = len(updates)
+        del updates
+        _, updates_bytes = retained(
+            lambda: [u for u in evaluate_all(bodies, installed, True) if u is not None]
+        )
+
+        full_peak = peak(lambda: evaluate_all(bodies, installed, False))
+        trimmed_peak = peak(lambda: evaluate_all(bodies, installed, True))
+        tracemalloc.stop()
+
+    def kib(size: int) -> str:
+        return f"{size / 1024:>9.0f} KiB"
+
+    print(f"{args.mods} mods, {args.releases} releases each, {update_count} updates")
+    print(f"{'':<16}{'before':>13}{'after':>13}{'saved':>8}")
+    for label, before, after in (
+        ("mods_data", legacy_mods_bytes, mods_bytes),
+        ("updates", legacy_updates_bytes, updates_bytes),
+        ("evaluate peak", full_peak, trimmed_peak),
+    ):
+        saved = 1 - after / before if before else 0
+        print(f"{label:<16}{kib(before)}{kib(after)}{saved:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
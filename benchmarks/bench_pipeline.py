@@ -0,0 +1,266 @@
+"""End-to-end benchmark of scan, check and download against a local fake Mod DB.
+
+Times UpdaterCore.populate_mods_data, check_for_updates (cold and warm caches, and
+after touching --changed of the mod zips) and update_mods on a synthetic profile, and
+reports throughput plus per-request latency. Also times how long a cold check takes to
+return when cancelled after --cancel-after seconds, and how many requests it still sent.
+
+Run from the repository root:
+    python -m benchmarks.bench_pipeline --mods 300 --latency 0.05
+    python -m benchmarks.bench_pipeline --json results.json
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+import argparse
+import tempfile
+import statistics
+
+from pathlib import Path
+from src.core import UpdaterCore
+from benchmarks.fake_moddb import FakeModDB
+from benchmarks.synthetic import GAME_VERSIONS, make_profile
+
+
+def percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"count": 0}
+    samples = sorted(samples)
+    return {
+        "count": len(samples),
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+        "max_ms": samples[-1] * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+    }
+
+
+def timed(func, samples: list[float]):
+    """Wraps func so the duration of every call is appended to samples."""
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+
+    return wrapper
+
+
+def run(args) -> dict:
+    results = {"config": vars(args).copy()}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        server = FakeModDB(
+            {},
+            {},
+            GAME_VERSIONS,
+            latency=args.latency,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+        ).start()
+        try:
+            mods, files = make_profile(
+                tmp / "mods",
+                args.mods,
+                args.zip_kib,
+                args.releases,
+                args.outdated,
+                server.url,
+                dependency_ratio=args.dependencies,
+            )
+            server.mods.update(mods)
+            server.files.update(files)
+
+            core = UpdaterCore(
+                tmp / "mods", GAME_VERSIONS[-1], tmp / "data", base_url=server.api_url
+            )
+            check_samples = []
+            download_samples = []
+            core.check_mod_for_update = timed(core.check_mod_for_update, check_samples)
+            core.update_mod = timed(core.update_mod, download_samples)
+
+            start = time.perf_counter()
+            core.populate_mods_data()
+            scan_cold = time.perf_counter() - start
+            start = time.perf_counter()
+            core.populate_mods_data()
+            scan_warm = time.perf_counter() - start
+            results["scan"] = {
+                "mods": core.mod_count,
+                "cold_s": scan_cold,
+                "warm_s": scan_warm,
+                "cold_mods_per_s": core.mod_count / scan_cold,
+            }
+
+            changed = sorted((tmp / "mods").glob("*/*.zip"))
+            changed = changed[: int(len(changed) * args.changed)]
+            for phase, force in (
+                ("check_cold", True),
+                ("check_warm", False),
+                ("check_changed", False),
+            ):
+                if phase == "check_changed":
+                    # A new modification time makes the zips count as changed
+                    for zip_path in changed:
+                        os.utime(zip_path, ns=(time.time_ns(), time.time_ns()))
+                server.reset_stats()
+                check_samples.clear()
+                core.force_refresh = force
+                first_update = None
+                start = time.perf_counter()
+
+                def on_update(update):
+                    nonlocal first_update
+                    if first_update is None:
+                        first_update = time.perf_counter() - start
+
+                updates = core.check_for_updates(on_update)
+                elapsed = time.perf_counter() - start
+                results[phase] = {
+                    "updates": len(updates),
+                    "elapsed_s": elapsed,
+                    "mods_per_s": core.mod_count / elapsed,
+                    "first_update_s": first_update,
+                    "requests": dict(server.requests),
+                    "statuses": dict(server.statuses),
+                    "connections": len(server.connections),
+                    "bytes": server.bytes_sent,
+                    "check_latency": percentiles(check_samples),
+                    "diagnostics": core.diagnostics.report(),
+                    "concurrency_limit": int(core.limiter.limit),
+                    "limit_decreases": core.limiter.decreases,
+                }
+
+            # A cold check cancelled partway, e.g. by the window's Cancel button
+            server.reset_stats()
+            core.force_refresh = True
+            cancel_event = threading.Event()
+            timer = threading.Timer(args.cancel_after, cancel_event.set)
+            start = time.perf_counter()
+            timer.start()
+            core.check_for_updates(cancel_event=cancel_event)
+            timer.cancel()
+            results["check_cancel"] = {
+                "cancel_after_s": args.cancel_after,
+                "elapsed_s": time.perf_counter() - start,
+                "mod_requests": server.requests.get("mod", 0),
+                "mods": core.mod_count,
+            }
+            core.force_refresh = False
+
+            server.reset_stats()
+            start = time.perf_counter()
+            errors = core.update_mods(updates)
+            elapsed = time.perf_counter() - start
+            results["download"] = {
+                "mods": len(updates),
+                "failed": sum(1 for error in errors.values() if error),
+                "elapsed_s": elapsed,
+                "mb_per_s": server.bytes_sent / 1024 / 1024 / elapsed if elapsed else 0,
+                "bytes": server.bytes_sent,
+                "statuses": dict(server.statuses),
+                "download_latency": percentiles(download_samples),
+                "diagnostics": core.diagnostics.report(),
+            }
+            core.close()
+        finally:
+            server.stop()
+    return results
+
+
+def print_results(results: dict):
+    scan = results["scan"]
+    print(
+        f"scan          {scan['mods']} mods: cold {scan['cold_s'] * 1000:.0f}ms "
+        f"({scan['cold_mods_per_s']:.0f} mods/s), warm {scan['warm_s'] * 1000:.0f}ms"
+    )
+    for phase in ("check_cold", "check_warm", "check_changed"):
+        check = results[phase]
+        latency = check["check_latency"]
+        first = check["first_update_s"]
+        print(
+            f"{phase:<14}{check['elapsed_s'] * 1000:.0f}ms "
+            f"({check['mods_per_s']:.0f} mods/s), {check['updates']} updates, "
+            f"first after {first * 1000 if first is not None else float('nan'):.0f}ms, "
+            f"requests {check['requests']}, statuses {check['statuses']}, "
+            f"{check['connections']} connections, {check['bytes'] / 1024:.0f} KiB, "
+            f"limit {check['concurrency_limit']} after "
+            f"{check['limit_decreases']} decreases"
+        )
+        if latency["count"]:
+            print(
+                f"              per-mod p50 {latency['p50_ms']:.1f}ms "
+                f"p95 {latency['p95_ms']:.1f}ms max {latency['max_ms']:.1f}ms"
+            )
+    cancel = results["check_cancel"]
+    print(
+        f"check_cancel  cancelled after {cancel['cancel_after_s'] * 1000:.0f}ms, "
+        f"returned after {cancel['elapsed_s'] * 1000:.0f}ms, "
+        f"{cancel['mod_requests']} of {cancel['mods']} mods requested"
+    )
+    download = results["download"]
+    latency = download["download_latency"]
+    print(
+        f"download      {download['mods']} mods "
+        f"in {download['elapsed_s'] * 1000:.0f}ms "
+        f"({download['mb_per_s']:.1f} MiB/s), {download['failed']} failed"
+    )
+    if latency["count"]:
+        print(
+            f"              per-mod p50 {latency['p50_ms']:.1f}ms "
+            f"p95 {latency['p95_ms']:.1f}ms max {latency['max_ms']:.1f}ms"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=200, help="Number of mods")
+    parser.add_argument("--zip-kib", type=int, default=256, help="Size of each zip")
+    parser.add_argument("--releases", type=int, default=20, help="Releases per mod")
+    parser.add_argument(
+        "--outdated", type=float, default=0.1, help="Fraction of outdated mods"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Server latency in seconds"
+    )
+    parser.add_argument(
+        "--dependencies",
+        type=float,
+        default=0.2,
+        help="Fraction of mods that depend on another mod",
+    )
+    parser.add_argument(
+        "--changed",
+        type=float,
+        default=0.05,
+        help="Fraction of mod zips touched before the last check",
+    )
+    parser.add_argument(
+        "--cancel-after",
+        type=float,
+        default=0.1,
+        help="Seconds into a cold check to cancel it",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 rate")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 rate")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+    results = run(args)
+    print_results(results)
+    if args.json:
+        results["config"]["json"] = str(args.json)
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Times update selection and changelog generation on mods with many releases.
+
+Compares the ReleaseIndex single pass against the previous check_mod_for_update +
+generate_changelog loops, and checks that both give the same result.
+
+Run from the repository root:
+    python -m benchmarks.bench_releases
+"""
+
+import time
+import random
+
+from src.releases import ReleaseIndex
+from src.utils import parse_version
+
+RELEASE_COUNTS = [100, 500, 2000]
+VS_VERSIONS = ["1.18.15", "1.19.8", "1.20.12", "1.21.0"]
+CURRENT_VS_VERSION = "1.20.12"
+REPEATS = 200
+
+
+def make_mod(release_count: int) -> dict:
+    """Returns a ModDB-style response with release_count releases, newest first."""
+    releases = []
+    for i in reversed(range(release_count)):
+        major, minor, patch = i // 100, i // 10 % 10, i % 10
+        tags = VS_VERSIONS[: 1 + i * len(VS_VERSIONS) // release_count]
+        releases.append(
+            {
+                "modversion": f"{major}.{minor}.{patch}"
+                + ("-rc.1" if random.random() < 0.1 else ""),
+                "tags": tags,
+                "changelog": f"<p>Changes in release {i}</p>",
+                "filename": f"mod_{i}.zip",
+                "mainfile": f"https://example.invalid/mod_{i}.zip",
+            }
+        )
+    return {"mod": {"name": "Benchmark Mod", "releases": releases}}
+
+
+def legacy_find_update(mod_db_info: dict, current_mod_version: str, vs_version: str):
+    """The update selection and changelog loops as they were before ReleaseIndex."""
+    current_mod_version_parsed = parse_version.__wrapped__(current_mod_version)
+    latest_mod_release = None
+    for release in mod_db_info["mod"]["releases"]:
+        release_version_parsed = parse_version.__wrapped__(release["modversion"])
+        latest_supported_vs_version = parse_version.__wrapped__(release["tags"][-1])
+        current_vs_version_parsed = parse_version.__wrapped__(vs_version)
+        if release_version_parsed > current_mod_version_parsed and (
+            vs_version in release["tags"]
+            or (
+                len(current_vs_version_parsed) >= 2
+                and len(latest_supported_vs_version) >= 2
+                and current_vs_version_parsed[1] == latest_supported_vs_version[1]
+            )
+        ):
+            latest_mod_release = release
+            break
+        elif current_mod_version_parsed >= release_version_parsed:
+            return None
+    if latest_mod_release is None:
+        return None
+
+    changelog = []
+    for release in mod_db_info["mod"]["releases"]:
+        release_version = parse_version.__wrapped__(release["modversion"])
+        if (
+            vs_version in release["tags"]
+            and release_version > current_mod_version_parsed
+        ):
+            changelog.append({release["modversion"]: release["changelog"]})
+        elif release_version == current_mod_version_parsed:
+            break
+    return latest_mod_release, changelog
+
+
+def indexed_find_update(mod_db_info: dict, current_mod_version: str, vs_version: str):
+    current_version_key = parse_version(current_mod_version)
+    return ReleaseIndex(mod_db_info, current_version_key).find_update(
+        current_version_key, vs_version
+    )
+
+
+def same_result(legacy, indexed) -> bool:
+    """Compares a legacy (release dict, changelog dicts) and a ReleaseIndex result."""
+    if legacy is None or indexed is None:
+        return legacy is indexed
+    legacy_release, legacy_changelog = legacy
+    release, changelog = indexed
+    return legacy_release["modversion"] == release.version and [
+        next(iter(changes.items())) for changes in legacy_changelog
+    ] == list(changelog)
+
+
+def time_per_call(func, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func(*args)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    random.seed(0)
+    print(f"{'releases':>8} {'legacy':>10} {'indexed':>10} {'speedup':>8}")
+    for release_count in RELEASE_COUNTS:
+        mod_db_info = make_mod(release_count)
+        # Installed version near the bottom, as for a mod many versions behind
+        releases = mod_db_info["mod"]["releases"]
+        current_mod_version = releases[-len(releases) // 10]["modversion"]
+
+        args = (mod_db_info, current_mod_version, CURRENT_VS_VERSION)
+        assert same_result(legacy_find_update(*args), indexed_find_update(*args))
+
+        legacy = time_per_call(legacy_find_update, *args)
+        indexed = time_per_call(indexed_find_update, *args)
+        print(
+            f"{release_count:>8} {legacy * 1e6:>8.0f}us {indexed * 1e6:>8.0f}us "
+            f"{legacy / indexed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Interrupted, resumed and corrupted downloads against a local fake Mod DB.
+
+Scenarios:
+    interrupted  the server drops a share of file responses halfway; downloads resume
+                 with Range requests, and mods that still fail are resumed from their
+                 ".part" file by a second update run, so every mod should install
+    leftover     a ".part" file from an earlier run is resumed, so only the rest of the
+                 file is transferred
+    corrupt      the served zip is damaged; it must be rejected and the installed zip
+                 kept
+
+Exits with status 1 if a scenario doesn't behave as described.
+
+Run from the repository root:
+    python -m benchmarks.bench_resume --mods 20 --interrupt-rate 0.3
+"""
+
+import sys
+import time
+import logging
+import argparse
+import tempfile
+
+from pathlib import Path
+from src.core import UpdaterCore
+from src.downloader import DownloadError, fetch_part, install_part
+from src.net import HttpClient
+from benchmarks.fake_moddb import FakeModDB
+from benchmarks.synthetic import GAME_VERSIONS, make_profile
+
+
+def run_interrupted(args, tmp: Path) -> dict:
+    server = FakeModDB({}, {}, GAME_VERSIONS, interrupt_rate=args.interrupt_rate)
+    server.start()
+    try:
+        mods, files = make_profile(
+            tmp / "mods", args.mods, args.zip_kib, 3, 1.0, server.url
+        )
+        server.mods.update(mods)
+        server.files.update(files)
+        core = UpdaterCore(
+            tmp / "mods", GAME_VERSIONS[-1], tmp / "data", base_url=server.api_url
+        )
+        updates = core.check_for_updates()
+        server.reset_stats()
+        start = time.perf_counter()
+        errors = core.update_mods(updates)
+        retried = [u for u in updates if errors[u.mod_id]]
+        errors.update(core.update_mods(retried))
+        elapsed = time.perf_counter() - start
+        core.close()
+    finally:
+        server.stop()
+
+    file_bytes = sum(len(files[u.latest_release.filename]) for u in updates)
+    return {
+        "mods": len(updates),
+        "second_run": len(retried),
+        "failed": sum(1 for error in errors.values() if error),
+        "interrupted": server.requests.get("interrupted", 0),
+        "range_requests": server.requests.get("range", 0),
+        # Resuming means nothing is sent twice
+        "overhead": server.bytes_sent / file_bytes - 1 if file_bytes else 0,
+        "elapsed_s": round(elapsed, 3),
+        "ok": not any(errors.values()) and server.bytes_sent == file_bytes,
+    }
+
+
+def one_mod(tmp: Path, server: FakeModDB, zip_kib: int) -> tuple[Path, dict, bytes]:
+    """Creates a mods folder with one outdated mod; returns its zip, release, file."""
+    mods, files = make_profile(tmp, 1, zip_kib, 3, 1.0, server.url)
+    server.mods.update(mods)
+    server.files.update(files)
+    release = mods["mod0"]["mod"]["releases"][0]
+    zip_path = next(tmp.glob("*/*.zip"))
+    return zip_path, release, files[release["filename"]]
+
+
+def install_release(client: HttpClient, release: dict, zip_path: Path) -> Path:
+    """Downloads a release next to zip_path and swaps it in, as an update does."""
+    part_path = zip_path.parent / (release["filename"] + ".part")
+    fetch_part(client, release["mainfile"], part_path)
+    return install_part(part_path, zip_path.parent / release["filename"], zip_path)
+
+
+def run_leftover(args, tmp: Path) -> dict:
+    server = FakeModDB({}, {}, GAME_VERSIONS).start()
+    client = HttpClient(1)
+    try:
+        zip_path, release, body = one_mod(tmp, server, args.zip_kib)
+        part_path = zip_path.parent / (release["filename"] + ".part")
+        part_path.write_bytes(body[: len(body) * 3 // 4])
+        server.reset_stats()
+        new_path = install_release(client, release, zip_path)
+    finally:
+        client.close()
+        server.stop()
+
+    return {
+        "file_bytes": len(body),
+        "bytes_sent": server.bytes_sent,
+        "range_requests": server.requests.get("range", 0),
+        "ok": new_path.read_bytes() == body
+        and server.bytes_sent == len(body) - len(body) * 3 // 4
+        and not part_path.exists(),
+    }
+
+
+def run_corrupt(args, tmp: Path) -> dict:
+    server = FakeModDB({}, {}, GAME_VERSIONS).start()
+    client = HttpClient(1)
+    try:
+        zip_path, release, body = one_mod(tmp, server, args.zip_kib)
+        # Flip bytes inside the first stored asset, leaving the zip structure intact
+        damaged = bytearray(body)
+        middle = len(damaged) // 3
+        for i in range(middle, middle + 16):
+            damaged[i] ^= 0xFF
+        server.files[release["filename"]] = bytes(damaged)
+        error = None
+        try:
+            install_release(client, release, zip_path)
+        except DownloadError as ex:
+            error = str(ex)
+    finally:
+        client.close()
+        server.stop()
+
+    return {
+        "error": error,
+        "ok": error is not None
+        and zip_path.exists()
+        and not (zip_path.parent / release["filename"]).exists()
+        and not (zip_path.parent / (release["filename"] + ".part")).exists(),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mods", type=int, default=20, help="Number of mods")
+    parser.add_argument("--zip-kib", type=int, default=512, help="Size of each zip")
+    parser.add_argument(
+        "--interrupt-rate",
+        type=float,
+        default=0.3,
+        help="Fraction of file responses that break off",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+    ok = True
+    for name, scenario in (
+        ("interrupted", run_interrupted),
+        ("leftover", run_leftover),
+        ("corrupt", run_corrupt),
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = scenario(args, Path(tmp))
+        ok &= result["ok"]
+        details = ", ".join(f"{k} {v}" for k, v in result.items() if k != "ok")
+        print(f"{name:<12}{'ok' if result['ok'] else 'FAILED'}: {details}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Times the mod zip scan against mod count and zip size.
+
+Run from the repository root:
+    python -m benchmarks.bench_scan
+"""
+
+import json
+import time
+import random
+import zipfile
+import logging
+import tempfile
+
+from pathlib import Path
+from src.mod_index import (
+    ModInfoCache,
+    ModsFolderIndex,
+    find_mod_zips,
+    get_mod_info_from_zip,
+    scan_mod_zips,
+)
+
+MOD_COUNTS = [50, 200, 400]
+# Approximate size of the asset payload in each zip, in KiB
+ZIP_SIZES_KIB = [16, 256, 1024]
+# Number of asset files the payload is split into
+ASSETS_PER_ZIP = 200
+
+
+def make_mods_dir(root: Path, mod_count: int, zip_size_kib: int):
+    """Creates an MO2-style mods folder with one mod zip per mod folder."""
+    asset_size = max(1, zip_size_kib * 1024 // ASSETS_PER_ZIP)
+    # Incompressible payload so zip size on disk matches the requested size
+    payload = random.randbytes(asset_size)
+    for i in range(mod_count):
+        mod_folder = root / f"Mod {i}"
+        mod_folder.mkdir()
+        with zipfile.ZipFile(mod_folder / f"mod{i}_1.0.0.zip", "w") as zip_ref:
+            for asset in range(ASSETS_PER_ZIP):
+                zip_ref.writestr(f"assets/mod{i}/textures/{asset}.png", payload)
+            zip_ref.writestr(
+                "modinfo.json",
+                json.dumps(
+                    {"ModID": f"mod{i}", "Name": f"Mod {i}", "Version": "1.0.0"}
+                ),
+            )
+
+
+def time_it(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def sequential_scan(mods_path: Path):
+    for zip_path in find_mod_zips(mods_path):
+        get_mod_info_from_zip(zip_path)
+
+
+def parallel_scan(mods_path: Path, cache: ModInfoCache | None = None):
+    for _ in scan_mod_zips(find_mod_zips(mods_path), cache):
+        pass
+
+
+def watched_scan(index: ModsFolderIndex, cache: ModInfoCache):
+    """Scans with a live folder index after one mod folder changed."""
+    index.changed(index.mods_path / "Mod 0")
+    for _ in scan_mod_zips(index.zip_paths(), cache):
+        pass
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    print(
+        f"{'mods':>6} {'size':>8} {'sequential':>12} {'parallel':>10} {'cached':>8} "
+        f"{'watched':>8}"
+    )
+    for zip_size_kib in ZIP_SIZES_KIB:
+        for mod_count in MOD_COUNTS:
+            with tempfile.TemporaryDirectory() as tmp:
+                mods_path = Path(tmp) / "mods"
+                mods_path.mkdir()
+                make_mods_dir(mods_path, mod_count, zip_size_kib)
+
+                sequential = time_it(lambda: sequential_scan(mods_path))
+                parallel = time_it(lambda: parallel_scan(mods_path))
+
+                # Warm the index, then time a scan of the unchanged modlist
+                cache = ModInfoCache(Path(tmp) / "mod_index.json")
+                parallel_scan(mods_path, cache)
+                cache.save()
+                cache = ModInfoCache(Path(tmp) / "mod_index.json")
+                cached = time_it(lambda: parallel_scan(mods_path, cache))
+
+                # Same, but only the changed folder is listed again
+                index = ModsFolderIndex(mods_path)
+                index.live = True
+                index.zip_paths()
+                watched = time_it(lambda: watched_scan(index, cache))
+
+                print(
+                    f"{mod_count:>6} {zip_size_kib:>6}Ki "
+                    f"{sequential * 1000:>10.1f}ms {parallel * 1000:>8.1f}ms "
+                    f"{cached * 1000:>6.1f}ms {watched * 1000:>6.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
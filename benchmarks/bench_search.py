@@ -0,0 +1,84 @@
+"""Times building the update search index and filtering with it as the user types.
+
+Run from the repository root:
+    python -m benchmarks.bench_search --updates 3000 --releases 20
+"""
+
+import time
+import argparse
+
+from src.records import Release, Update
+from src.search import SearchIndex, update_texts
+from benchmarks.synthetic import make_releases
+
+# What a user might type, one key at a time
+QUERIES = ["c", "ca", "car", "carry", "carry fix", "1.0", "mod12", "zzz"]
+
+
+def make_updates(update_count: int, release_count: int, changelog_chars: int):
+    updates = []
+    for i in range(update_count):
+        mod_id = f"mod{i}"
+        releases = make_releases(
+            mod_id, release_count, "http://127.0.0.1", changelog_chars
+        )
+        releases = [Release.from_api(release) for release in releases]
+        name = f"Carry On {i}" if i % 50 == 0 else f"Mod {i:05d}"
+        changelog = tuple((r.version, r.changelog) for r in releases[:-1])
+        updates.append(
+            Update(mod_id, name, releases[-1].version, releases[0], changelog)
+        )
+    return updates
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=3000, help="Number of updates")
+    parser.add_argument(
+        "--releases", type=int, default=20, help="Changelog entries per update"
+    )
+    parser.add_argument(
+        "--changelog-chars", type=int, default=600, help="Length of each changelog"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    updates = make_updates(args.updates, args.releases, args.changelog_chars)
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    for update in updates:
+        index.add(update.mod_id, update_texts(update))
+    build = time.perf_counter() - start
+    print(
+        f"{args.updates} updates, {args.updates * (args.releases - 1)} changelog "
+        f"entries, {len(index.postings)} tokens: indexed in {build * 1000:.0f}ms"
+    )
+
+    print(f"{'query':<12}{'matches':>8}{'first':>10}{'cached':>10}{'linear':>10}")
+    for query in QUERIES:
+        index.changed()
+        start = time.perf_counter()
+        matches = index.search(query)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        index.search(query)
+        cached = time.perf_counter() - start
+
+        # Scanning every update's text, as a filter without the index would
+        start = time.perf_counter()
+        words = query.lower().split()
+        for update in updates:
+            text = " ".join(update_texts(update)).lower()
+            all(word in text for word in words)
+        linear = time.perf_counter() - start
+        print(
+            f"{query:<12}{len(matches):>8}{first * 1000:>8.2f}ms"
+            f"{cached * 1000:>8.2f}ms{linear * 1000:>8.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Local stand-in for the Mod DB API and file downloads.
+
+Serves /api/mods, /api/mod/{id}, /api/gameversions and /files/{name} from an in-memory
+catalog, with configurable latency, error rate, 429 throttling and downloads that break
+off midway. Files honour "Range: bytes=N-" requests.
+"""
+
+import json
+import time
+import random
+import hashlib
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeModDB:
+    """Threaded HTTP/1.1 keep-alive server, run with start() and stopped with stop().
+
+    mods maps mod ids to Mod DB style {"mod": {...}} responses and files maps file names
+    to zip bytes.
+    """
+
+    def __init__(
+        self,
+        mods: dict[str, dict],
+        files: dict[str, bytes],
+        game_versions: list[str],
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        interrupt_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.mods = mods
+        self.files = files
+        self.game_versions = game_versions
+        # Seconds added to every response
+        self.latency = latency
+        # Fraction of requests answered with 503 and 429
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        # Fraction of file responses whose connection drops halfway through the body
+        self.interrupt_rate = interrupt_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # Counts of requests per route ("mod", "mods", "file", ...) and per status
+        self.requests = {}
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.connections = set()
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.url}/api"
+
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                fake.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def reset_stats(self):
+        with self.lock:
+            self.requests.clear()
+            self.statuses.clear()
+            self.bytes_sent = 0
+            self.connections.clear()
+
+    def route(self, path: str) -> tuple[str, object]:
+        """Returns the route name of a path and the object it serves, or None."""
+        path = path.split("?", 1)[0]
+        if path == "/api/mods":
+            return "mods", {"statuscode": "200", "mods": self.listing()}
+        if path == "/api/gameversions":
+            return "gameversions", {
+                "statuscode": "200",
+                "gameversions": [{"name": v} for v in self.game_versions],
+            }
+        if path.startswith("/api/mod/"):
+            return "mod", self.mods.get(path[len("/api/mod/") :])
+        if path.startswith("/files/"):
+            return "file", self.files.get(path[len("/files/") :].replace("%20", " "))
+        return "unknown", None
+
+    def listing(self) -> list[dict]:
+        return [
+            {
+                "modidstrs": [mod_id],
+                "name": data["mod"]["name"],
+                "lastreleased": data["mod"]["releases"][0]["created"],
+            }
+            for mod_id, data in self.mods.items()
+        ]
+
+    def handle(self, handler: BaseHTTPRequestHandler):
+        if self.latency:
+            time.sleep(self.latency)
+        route, payload = self.route(handler.path)
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            self.connections.add(handler.client_address)
+            roll = self.random.random()
+
+        if roll < self.throttle_rate:
+            self.respond(handler, 429, b"", {"Retry-After": "0"})
+        elif roll < self.throttle_rate + self.error_rate:
+            self.respond(handler, 503, b"")
+        elif payload is None:
+            self.respond(handler, 404, b"")
+        elif route == "file":
+            self.respond_file(handler, payload)
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if handler.headers.get("If-None-Match") == etag:
+                self.respond(handler, 304, b"", {"ETag": etag})
+            else:
+                self.respond(
+                    handler,
+                    200,
+                    body,
+                    {"ETag": etag, "Content-Type": "application/json"},
+                )
+
+    def respond_file(self, handler: BaseHTTPRequestHandler, body: bytes):
+        headers = {"Content-Type": "application/zip", "Accept-Ranges": "bytes"}
+        status = 200
+        size = len(body)
+        range_header = handler.headers.get("Range") or ""
+        if range_header.startswith("bytes=") and range_header.endswith("-"):
+            start = int(range_header[len("bytes=") : -1])
+            if start >= size:
+                self.respond(handler, 416, b"", {"Content-Range": f"bytes */{size}"})
+                return
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{size - 1}/{size}"
+            body = body[start:]
+            with self.lock:
+                self.requests["range"] = self.requests.get("range", 0) + 1
+
+        with self.lock:
+            interrupt = self.random.random() < self.interrupt_rate
+        if not interrupt:
+            self.respond(handler, status, body, headers)
+            return
+
+        # Promise the whole body, send half of it and hang up
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        sent = body[: len(body) // 2]
+        handler.wfile.write(sent)
+        handler.wfile.flush()
+        handler.close_connection = True
+        with self.lock:
+            self.requests["interrupted"] = self.requests.get("interrupted", 0) + 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_sent += len(sent)
+
+    def respond(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        body: bytes,
+        headers: dict | None = None,
+    ):
+        handler.send_response(status)
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if body:
+            handler.wfile.write(body)
+        with self.lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_sent += len(body)
@@ -0,0 +1,135 @@
+"""Generates synthetic MO2 mods folders and the matching Mod DB catalog."""
+
+import io
+import json
+import random
+import zipfile
+
+from pathlib import Path
+
+GAME_VERSIONS = ["1.18.15", "1.19.8", "1.20.0", "1.20.12"]
+
+
+def make_mod_zip(
+    mod_id: str,
+    version: str,
+    size_kib: int,
+    seed: int = 0,
+    dependencies: dict[str, str] | None = None,
+) -> bytes:
+    """Returns a mod zip with modinfo.json and ~size_kib of incompressible assets."""
+    rng = random.Random(seed)
+    buffer = io.BytesIO()
+    mod_info = {
+        "Type": "code",
+        "ModID": mod_id,
+        "Name": f"Mod {mod_id}",
+        "Version": version,
+        "Authors": ["Someone", "Someone Else"],
+        "Description": f"Synthetic mod {mod_id}. " * 12,
+        "Website": f"https://mods.vintagestory.at/{mod_id}",
+        "Side": "Universal",
+        "RequiredOnClient": True,
+        "RequiredOnServer": True,
+    }
+    if dependencies:
+        mod_info["Dependencies"] = {"game": "", **dependencies}
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr("modinfo.json", json.dumps(mod_info))
+        remaining = size_kib * 1024
+        asset = 0
+        while remaining > 0:
+            chunk = min(remaining, 64 * 1024)
+            zip_ref.writestr(f"assets/{mod_id}/{asset}.bin", rng.randbytes(chunk))
+            remaining -= chunk
+            asset += 1
+    return buffer.getvalue()
+
+
+def make_releases(
+    mod_id: str, release_count: int, base_url: str, changelog_chars: int = 0
+) -> list[dict]:
+    """Returns release_count Mod DB releases, newest first, versions 1.0.0 upwards.
+
+    Changelogs are padded to about changelog_chars characters.
+    """
+    releases = []
+    for i in reversed(range(release_count)):
+        version = f"1.{i // 10}.{i % 10}"
+        tags = GAME_VERSIONS[: 1 + i * len(GAME_VERSIONS) // release_count]
+        filename = f"{mod_id}_{version}.zip"
+        changelog = f"<p>Release {version} of {mod_id}</p>"
+        if changelog_chars > len(changelog):
+            filler = "<li>Fixed a thing</li>" * (changelog_chars // 22)
+            changelog += f"<ul>{filler}</ul>"
+        releases.append(
+            {
+                "modversion": version,
+                "tags": tags,
+                "changelog": changelog,
+                "filename": filename,
+                "mainfile": f"{base_url}/files/{filename}",
+                "created": f"2024-01-01 00:00:{i % 60:02d}",
+                "releaseid": i,
+                "downloads": i * 10,
+            }
+        )
+    return releases
+
+
+def make_profile(
+    mods_path: Path,
+    mod_count: int,
+    zip_size_kib: int,
+    release_count: int,
+    outdated_ratio: float,
+    base_url: str,
+    seed: int = 0,
+    dependency_ratio: float = 0.0,
+    changelog_chars: int = 0,
+) -> tuple[dict[str, dict], dict[str, bytes]]:
+    """Creates an MO2 mods folder and returns the (mods, files) catalog for FakeModDB.
+
+    outdated_ratio of the mods are installed one release behind the latest, the rest are
+    installed at the latest release. Only the latest release of each mod gets a file.
+    dependency_ratio of the mods depend on an earlier mod, and their latest release
+    needs the latest release of that mod.
+    """
+    rng = random.Random(seed)
+    mods = {}
+    files = {}
+    for i in range(mod_count):
+        mod_id = f"mod{i}"
+        releases = make_releases(mod_id, release_count, base_url, changelog_chars)
+        mods[mod_id] = {"mod": {"name": f"Mod {i:04d}", "releases": releases}}
+
+        outdated = rng.random() < outdated_ratio and release_count > 1
+        installed = releases[1 if outdated else 0]
+        dependency = None
+        if i and rng.random() < dependency_ratio:
+            dependency = f"mod{rng.randrange(i)}"
+        folder = mods_path / f"Mod {i:04d}"
+        folder.mkdir(parents=True)
+        (folder / installed["filename"]).write_bytes(
+            make_mod_zip(
+                mod_id,
+                installed["modversion"],
+                zip_size_kib,
+                seed=i,
+                dependencies={dependency: ""} if dependency else None,
+            )
+        )
+        latest = releases[0]
+        files[latest["filename"]] = make_mod_zip(
+            mod_id,
+            latest["modversion"],
+            zip_size_kib,
+            seed=i + 1,
+            dependencies=(
+                {dependency: mods[dependency]["mod"]["releases"][0]["modversion"]}
+                if dependency
+                else None
+            ),
+        )
+        latest["filesize"] = len(files[latest["filename"]])
+    return mods, files
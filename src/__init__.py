@@ -1,5 +1,11 @@
-from .vs_mod_updater import VSModUpdaterPlugin
-import mobase  # type: ignore
+from typing import TYPE_CHECKING
 
-def createPlugin() -> mobase.IPlugin:
-    return VSModUpdaterPlugin()
\ No newline at end of file
+if TYPE_CHECKING:
+    import mobase  # type: ignore
+
+
+def createPlugin() -> "mobase.IPlugin":
+    # Imported here so the Qt-free modules of this package can be used outside MO2
+    from .vs_mod_updater import VSModUpdaterPlugin
+
+    return VSModUpdaterPlugin()
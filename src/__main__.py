@@ -0,0 +1,215 @@
+"""Command line entry point for checking and updating mods without MO2.
+
+Run from the folder containing this package, e.g. for a plugin install:
+    python -m vs_mod_updater check --mods-path C:/MO2/mods --game-version 1.20.12
+
+Results are printed to stdout as JSON; logs go to stderr.
+"""
+
+from .core import (
+    BASE_URL,
+    DEFAULT_CACHE_SIZE_MB,
+    DEFAULT_CACHE_TTL_MINUTES,
+    UpdaterCore,
+)
+from .scheduler import DEFAULT_MAX_CONCURRENCY, DEFAULT_MIN_CONCURRENCY
+from .archive_cache import DEFAULT_ARCHIVE_CACHE_SIZE_MB
+from .records import Update
+from .utils import parse_version
+
+import sys
+import json
+import logging
+import argparse
+
+from pathlib import Path
+
+DEFAULT_DATA_PATH = Path.home() / ".cache" / "vs_mod_updater"
+
+
+def summarize_update(update: Update, with_changelog: bool) -> dict:
+    """Returns the JSON-friendly fields of an update."""
+    summary = {
+        "mod_id": update.mod_id,
+        "name": update.name,
+        "current_version": update.current_version,
+        "latest_version": update.latest_version,
+        "filename": update.latest_release.filename,
+        "url": update.latest_release.mainfile,
+    }
+    if with_changelog:
+        summary["changelog"] = [{version: text} for version, text in update.changelog]
+    return summary
+
+
+def rollback(core: UpdaterCore, mod_id: str, version: str | None) -> dict:
+    """Reinstalls a cached version of a mod, returning the JSON-friendly result."""
+    core.populate_mods_data()
+    mod = core.mods_data.get(mod_id)
+    if mod is None:
+        return {"mod_id": mod_id, "failed": "Not installed"}
+    previous_version = mod.version
+    if version is None:
+        installed = parse_version(previous_version or "0")
+        older = [
+            v for v in core.cached_versions(mod_id) if parse_version(v) < installed
+        ]
+        if not older:
+            return {
+                "mod_id": mod_id,
+                "failed": "No earlier version in the archive cache",
+            }
+        version = older[0]
+
+    try:
+        zip_path = core.rollback_mod(mod_id, version)
+    except Exception as ex:
+        logging.critical(f"Error rolling back {mod_id}: {ex}")
+        return {"mod_id": mod_id, "failed": str(ex)}
+    return {
+        "mod_id": mod_id,
+        "previous_version": previous_version,
+        "version": version,
+        "path": str(zip_path),
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="vs_mod_updater",
+        description="Check and update Vintage Story mods in an MO2 mods folder.",
+    )
+    parser.add_argument(
+        "command",
+        choices=["scan", "check", "update", "rollback", "matrix"],
+        help="scan: list installed mods, check: list updates, update: install updates, "
+        "rollback: reinstall an earlier version of --mod from the archive cache, "
+        "matrix: newest release of every mod for each --target VS version",
+    )
+    parser.add_argument("--mods-path", type=Path, required=True)
+    parser.add_argument(
+        "--game-version", required=True, help="Installed VS version, e.g. 1.20.12"
+    )
+    parser.add_argument(
+        "--data-path",
+        type=Path,
+        default=DEFAULT_DATA_PATH,
+        help=f"Folder for caches (default: {DEFAULT_DATA_PATH})",
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=DEFAULT_CACHE_TTL_MINUTES, help="Minutes"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=DEFAULT_CACHE_SIZE_MB, help="MB"
+    )
+    parser.add_argument(
+        "--archive-cache-size",
+        type=int,
+        default=DEFAULT_ARCHIVE_CACHE_SIZE_MB,
+        help="MB of downloaded and replaced mod zips to keep",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        dest="targets",
+        metavar="VERSION",
+        help="VS version for matrix, repeatable (default: installed and latest)",
+    )
+    parser.add_argument("--mod", help="Mod id to roll back")
+    parser.add_argument(
+        "--version",
+        dest="mod_version",
+        help="Version to roll back to "
+        "(default: newest cached one before the installed)",
+    )
+    parser.add_argument(
+        "--min-connections",
+        type=int,
+        default=DEFAULT_MIN_CONCURRENCY,
+        help="Requests kept in flight when Mod DB is slow or throttling",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Most requests in flight at once",
+    )
+    parser.add_argument(
+        "--force-refresh", action="store_true", help="Ignore cached Mod DB data"
+    )
+    parser.add_argument(
+        "--changelog", action="store_true", help="Include changelogs in the output"
+    )
+    parser.add_argument(
+        "--diagnostics",
+        type=Path,
+        metavar="PATH",
+        help="Write timings, request latencies and cache hit rates to this JSON file",
+    )
+    parser.add_argument("--api-url", default=BASE_URL, help=argparse.SUPPRESS)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "rollback" and not args.mod:
+        sys.stderr.write("rollback needs --mod\n")
+        return 2
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING, stream=sys.stderr
+    )
+
+    core = UpdaterCore(
+        args.mods_path,
+        args.game_version,
+        args.data_path,
+        args.cache_ttl,
+        args.cache_size,
+        args.api_url,
+        args.min_connections,
+        args.max_connections,
+        args.archive_cache_size,
+    )
+    core.force_refresh = args.force_refresh
+
+    try:
+        if args.command == "scan":
+            core.populate_mods_data()
+            result = [
+                {
+                    "mod_id": mod_id,
+                    "name": mod.name,
+                    "version": mod.version,
+                    "path": str(mod.path),
+                    "cached_versions": core.cached_versions(mod_id),
+                }
+                for mod_id, mod in sorted(core.mods_data.items())
+            ]
+        elif args.command == "rollback":
+            result = rollback(core, args.mod, args.mod_version)
+        elif args.command == "matrix":
+            result = core.compatibility_matrix(args.targets)
+        else:
+            updates = core.check_for_updates()
+            result = {
+                "game_version": args.game_version,
+                "mod_count": core.mod_count,
+                "updates": [summarize_update(u, args.changelog) for u in updates],
+            }
+            if args.command == "update":
+                errors = core.update_mods(updates)
+                result["updated"] = [m for m, error in errors.items() if not error]
+                result["failed"] = {m: error for m, error in errors.items() if error}
+    finally:
+        core.close()
+        if args.diagnostics is not None:
+            core.diagnostics.write(args.diagnostics)
+
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if isinstance(result, dict) and result.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+from .records import Release
+from .json_store import load_versioned_json, save_versioned_json
+
+import os
+import time
+import shutil
+import hashlib
+import logging
+import threading
+
+from pathlib import Path
+
+DEFAULT_ARCHIVE_CACHE_SIZE_MB = 1024
+
+
+def file_sha256(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(1024 * 1024):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def link_or_copy(source: Path, destination: Path):
+    """Hardlinks source to destination, or copies it if they are on different drives."""
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+class ArchiveCache:
+    """Size-bounded, content-addressed store of mod zips.
+
+    Every zip is stored once under its SHA-256 hash in the objects folder, and any
+    number of keys point at it: "file:<file id>" and "url:<download url>" for Mod DB
+    release files and "mod:<mod id>@<version>" for every version that was installed,
+    including replaced ones. Zips go in and out as hardlinks where the file system
+    allows it, so caching an installed zip costs no space or copying. The least recently
+    used zips are evicted once the objects folder grows past max_bytes.
+    """
+
+    # Bump when the stored layout changes so stale indexes are discarded
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.objects_dir = cache_dir / "objects"
+        self.index_path = cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        # Keys are cache keys, values are hashes
+        self.keys = {}
+        # Keys are hashes, values are {"size", "filename", "last_used"}
+        self.objects = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Loads the index from disk, starting empty if it is missing or unreadable."""
+        data = load_versioned_json(
+            self.index_path, self.FORMAT_VERSION, "archive cache"
+        )
+        if data is not None:
+            self.keys = data.get("keys", {})
+            self.objects = data.get("objects", {})
+
+    def save(self):
+        """Writes the index to disk; called with the lock held."""
+        save_versioned_json(
+            self.index_path,
+            self.FORMAT_VERSION,
+            {"keys": self.keys, "objects": self.objects},
+            "archive cache",
+        )
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects_dir / f"{sha256}.zip"
+
+    def get(self, keys: list[str]) -> tuple[Path, dict] | None:
+        """Returns the stored zip and its entry for the first known key, or None."""
+        with self.lock:
+            for key in keys:
+                sha256 = self.keys.get(key)
+                if sha256 is None or sha256 not in self.objects:
+                    continue
+                path = self.object_path(sha256)
+                if not path.exists():
+                    self.forget(sha256)
+                    continue
+                entry = self.objects[sha256]
+                entry["last_used"] = time.time()
+                self.save()
+                return path, {"sha256": sha256, **entry}
+        return None
+
+    def put(self, zip_path: Path, keys: list[str], sha256: str | None = None):
+        """Stores a zip under keys, unless it is larger than the whole cache."""
+        try:
+            size = zip_path.stat().st_size
+            if size > self.max_bytes:
+                return
+            sha256 = sha256 or file_sha256(zip_path)
+            path = self.object_path(sha256)
+            with self.lock:
+                if sha256 not in self.objects or not path.exists():
+                    self.objects_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_suffix(".tmp")
+                    link_or_copy(zip_path, tmp_path)
+                    os.replace(tmp_path, path)
+                self.objects[sha256] = {
+                    "size": size,
+                    "filename": zip_path.name,
+                    "last_used": time.time(),
+                }
+                for key in keys:
+                    self.keys[key] = sha256
+                self.evict()
+                self.save()
+        except Exception as ex:
+            logging.warning(f"Could not cache {zip_path.name}: {ex}")
+
+    def discard_if_corrupt(self, sha256: str) -> bool:
+        """Removes a stored zip whose contents no longer match its hash."""
+        path = self.object_path(sha256)
+        try:
+            if path.exists() and file_sha256(path) == sha256:
+                return False
+        except OSError:
+            pass
+        logging.warning(f"Removing corrupt cached zip {path.name}")
+        with self.lock:
+            self.forget(sha256)
+            self.save()
+        return True
+
+    def versions(self, mod_id: str) -> dict[str, Path]:
+        """Returns the stored zips of a mod, keyed by version."""
+        prefix = f"mod:{mod_id.lower()}@"
+        with self.lock:
+            return {
+                key[len(prefix) :]: self.object_path(sha256)
+                for key, sha256 in self.keys.items()
+                if key.startswith(prefix) and sha256 in self.objects
+            }
+
+    def evict(self):
+        """Evicts the least recently used zips until the cache fits; needs the lock."""
+        total = sum(entry["size"] for entry in self.objects.values())
+        by_age = sorted(self.objects, key=lambda h: self.objects[h]["last_used"])
+        for sha256 in by_age:
+            if total <= self.max_bytes:
+                break
+            total -= self.objects[sha256]["size"]
+            self.forget(sha256)
+
+    def forget(self, sha256: str):
+        """Removes one zip and its keys; called with the lock held."""
+        self.objects.pop(sha256, None)
+        for key in [k for k, h in self.keys.items() if h == sha256]:
+            del self.keys[key]
+        try:
+            self.object_path(sha256).unlink(missing_ok=True)
+        except OSError as ex:
+            logging.debug(f"Could not remove cached zip {sha256}: {ex}")
+
+
+def release_keys(mod_id: str, release: Release) -> list[str]:
+    """Returns the archive cache keys of a Mod DB release file."""
+    keys = [f"url:{release.mainfile}"]
+    if release.fileid:
+        keys.insert(0, f"file:{release.fileid}")
+    if release.version:
+        keys.append(f"mod:{mod_id.lower()}@{release.version}")
+    return keys
@@ -0,0 +1,150 @@
+from .records import Update
+from .json_store import load_versioned_json, save_versioned_json
+
+import os
+import time
+import logging
+import threading
+
+from pathlib import Path
+
+
+class CheckResults:
+    """On-disk record of the last update check of every mod.
+
+    Entries are keyed by mod id and hold the update found for the mod (or None), along
+    with what it was based on: the mod zip's size and modification time, the game
+    version and the mod's last release time from the Mod DB listing. An entry is reused
+    while all of those still match, so a check only has to re-evaluate mods that were
+    changed locally or got a new release.
+    """
+
+    # Bump when the stored layout changes so stale results are discarded
+    FORMAT_VERSION = 2
+
+    def __init__(self, results_path: Path):
+        self.results_path = results_path
+        # Keys are mod ids, values are {"zip", "size", "mtime_ns", "game_version",
+        # "last_released", "checked_at", "update"}; updates are stored as dicts on disk
+        self.entries = {}
+        # When the last check that wasn't cancelled finished
+        self.last_checked = None
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Loads the results from disk, starting empty if missing or unreadable."""
+        data = load_versioned_json(
+            self.results_path, self.FORMAT_VERSION, "check results"
+        )
+        if data is None:
+            return
+        try:
+            entries = data.get("entries", {})
+            for entry in entries.values():
+                if entry["update"] is not None:
+                    entry["update"] = Update.from_dict(entry["update"])
+            self.entries = entries
+            self.last_checked = data.get("last_checked")
+        except Exception as ex:
+            logging.warning(f"Could not read check results {self.results_path}: {ex}")
+            self.entries = {}
+
+    def save(self):
+        """Writes the results to disk if anything changed since they were loaded."""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {
+                "last_checked": self.last_checked,
+                "entries": {
+                    mod_id: {
+                        **entry,
+                        "update": entry["update"] and entry["update"].to_dict(),
+                    }
+                    for mod_id, entry in self.entries.items()
+                },
+            }
+            self.dirty = False
+        save_versioned_json(
+            self.results_path, self.FORMAT_VERSION, data, "check results"
+        )
+
+    def get(
+        self,
+        mod_id: str,
+        zip_path: Path,
+        stat: os.stat_result,
+        game_version: str,
+        last_released: str | None,
+        max_age: float,
+    ) -> dict | None:
+        """Returns the last result of a mod if it still applies, or None.
+
+        Without a last release time to compare, results are trusted for max_age seconds.
+        """
+        with self.lock:
+            entry = self.entries.get(mod_id)
+        if (
+            entry is None
+            or entry["zip"] != str(zip_path)
+            or entry["size"] != stat.st_size
+            or entry["mtime_ns"] != stat.st_mtime_ns
+            or entry["game_version"] != game_version
+        ):
+            return None
+        if last_released is not None:
+            return entry if entry["last_released"] == last_released else None
+        return entry if time.time() - entry["checked_at"] < max_age else None
+
+    def put(
+        self,
+        mod_id: str,
+        zip_path: Path,
+        stat: os.stat_result,
+        game_version: str,
+        last_released: str | None,
+        update: Update | None,
+    ):
+        with self.lock:
+            self.entries[mod_id] = {
+                "zip": str(zip_path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "game_version": game_version,
+                "last_released": last_released,
+                "checked_at": time.time(),
+                "update": update,
+            }
+            self.dirty = True
+
+    def finish(self, mod_ids: set[str]):
+        """Marks a check as complete and drops results of mods that are gone."""
+        with self.lock:
+            for mod_id in [m for m in self.entries if m not in mod_ids]:
+                del self.entries[mod_id]
+            self.last_checked = time.time()
+            self.dirty = True
+
+    def updates(self, game_version: str) -> list[Update]:
+        """Returns the stored updates whose mod zip is unchanged, sorted by name.
+
+        Only the zips of mods with an update are looked at, so this stays fast for
+        any number of mods.
+        """
+        with self.lock:
+            entries = list(self.entries.values())
+
+        updates = []
+        for entry in entries:
+            if entry["update"] is None or entry["game_version"] != game_version:
+                continue
+            try:
+                stat = os.stat(entry["zip"])
+            except OSError:
+                continue
+            if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+                updates.append(entry["update"])
+        updates.sort(key=lambda x: x.name)
+        return updates
@@ -0,0 +1,668 @@
+from .utils import parse_version, parse_timestamp
+from .mod_index import (
+    ModInfoCache,
+    ModsFolderIndex,
+    get_mod_info_from_zip,
+    scan_mod_zips,
+)
+from .http_cache import ResponseCache
+from .moddb import ModDBApi
+from .downloader import MAX_DOWNLOAD_WORKERS, DownloadError, fetch_part, install_part
+from .archive_cache import (
+    DEFAULT_ARCHIVE_CACHE_SIZE_MB,
+    ArchiveCache,
+    link_or_copy,
+    release_keys,
+)
+from .net import HttpClient
+from .releases import ReleaseIndex
+from .records import Mod, Update
+from .diagnostics import Diagnostics
+from .check_results import CheckResults
+from .dependencies import UpdatePlan, get_dependencies, version_satisfies
+from .scheduler import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MIN_CONCURRENCY,
+    AdaptiveLimiter,
+    ResultCollector,
+)
+
+import time
+import logging
+import threading
+import concurrent.futures
+
+from pathlib import Path
+from typing import Callable, Iterable
+
+# Base vintage story Mod DB API url
+BASE_URL = "https://mods.vintagestory.at/api"
+DEFAULT_CACHE_TTL_MINUTES = 30
+DEFAULT_CACHE_SIZE_MB = 64
+
+
+class UpdaterCore:
+    """Scans, checks and updates the Vintage Story mods of a mods folder.
+
+    Has no Qt or MO2 dependency, so it backs both the plugin window and the command
+    line. Callbacks passed to check_for_updates and update_mods are called from worker
+    threads.
+    """
+
+    def __init__(
+        self,
+        mods_path: Path,
+        current_vs_version: str,
+        data_path: Path,
+        cache_ttl_minutes: float = DEFAULT_CACHE_TTL_MINUTES,
+        cache_size_mb: int = DEFAULT_CACHE_SIZE_MB,
+        base_url: str = BASE_URL,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        archive_cache_size_mb: int = DEFAULT_ARCHIVE_CACHE_SIZE_MB,
+        mods_index: ModsFolderIndex | None = None,
+    ):
+        self.mods_path = mods_path
+        # Mod zip of every mod folder; the plugin keeps it live with a watcher
+        self.mods_index = mods_index or ModsFolderIndex(mods_path)
+        self.current_vs_version = current_vs_version
+        # Folder for caches
+        self.data_path = data_path
+        # Keys are mod ids, values are Mod records of the installed mods
+        self.mods_data = {}
+        # Number of mod zips found by the last scan
+        self.mod_count = 0
+        # Timings and counters of the last check and the downloads after it
+        self.diagnostics = Diagnostics()
+        # Parsed modinfo.json files, reused while a mod zip is unchanged
+        self.mod_info_cache = ModInfoCache(data_path / "mod_index.json")
+        # Results of the last check, reused for mods with no local change or new release
+        self.check_results = CheckResults(data_path / "last_check.json")
+        self.cache_ttl = float(cache_ttl_minutes) * 60
+        # Requests in flight to Mod DB, adapted to how fast and how often it answers
+        self.limiter = AdaptiveLimiter(int(min_concurrency), int(max_concurrency))
+        # Shared keep-alive connections for every ModDB request and download
+        self.http = HttpClient(
+            self.limiter.ceiling, diagnostics=self.diagnostics, limiter=self.limiter
+        )
+        # ModDB responses, reused for cache_ttl_minutes and revalidated afterwards
+        self.api = ModDBApi(
+            base_url,
+            self.http,
+            ResponseCache(data_path / "http_cache", int(cache_size_mb) * 1024 * 1024),
+            self.cache_ttl,
+            self.diagnostics,
+        )
+        # Downloaded and replaced mod zips, for installs and rollbacks without Mod DB
+        self.archive_cache = ArchiveCache(
+            data_path / "archives", int(archive_cache_size_mb) * 1024 * 1024
+        )
+        self.force_refresh = False
+        # Run first on every worker thread the core starts, e.g. to lower its priority
+        self.thread_initializer = None
+        # Last release time of every ModDB mod, used to skip mods with nothing new
+        self.release_dates = {}
+
+    def close(self):
+        self.http.close()
+
+    def check_for_updates(
+        self,
+        on_update: Callable[[Update], None] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> list[Update]:
+        """Scans the mods folder and checks every mod for an update.
+
+        Each mod is checked as soon as its zip has been read. on_update is called with
+        every update as soon as it is found and on_progress with (mods checked, total
+        mods); the total is only final once the scan has finished.
+
+        Returns the updates sorted by name.
+        """
+        self.diagnostics.reset()
+        with self.diagnostics.phase("check"), self.http.cancelled_by(cancel_event):
+            return self._check_for_updates(on_update, on_progress, cancel_event)
+
+    def _check_for_updates(self, on_update, on_progress, cancel_event) -> list[Update]:
+        self.fetch_release_dates()
+        # Keys are mod ids, values are updates or None
+        collector = ResultCollector(on_progress)
+        # Returned by checks that were still queued when the check was cancelled
+        skipped = object()
+
+        def check(mod_id: str):
+            if cancel_event is not None and cancel_event.is_set():
+                return skipped
+            return self.check_mod_for_update(mod_id)
+
+        def on_mod_checked(mod_id: str, future: concurrent.futures.Future):
+            if future.cancelled():
+                return
+            update = None
+            try:
+                update = future.result()
+                if update is skipped:
+                    return
+                if update is not None and on_update is not None:
+                    on_update(update)
+            except Exception as ex:
+                logging.critical(f"Error checking mod {mod_id}: {ex}")
+            collector.add(mod_id, update)
+
+        # One thread per possible request in flight; the limiter decides how many send
+        with concurrent.futures.ThreadPoolExecutor(
+            self.limiter.ceiling, initializer=self.thread_initializer
+        ) as executor:
+
+            def on_mod_found(mod_id: str):
+                future = executor.submit(check, mod_id)
+                future.add_done_callback(lambda f: on_mod_checked(mod_id, f))
+
+            found = self.populate_mods_data(on_mod_found, cancel_event)
+            # Invalid and duplicate zips count as checked
+            collector.skip(found - len(self.mods_data))
+            collector.set_total(found)
+
+            if cancel_event is not None and cancel_event.is_set():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        if cancel_event is None or not cancel_event.is_set():
+            self.check_results.finish(set(self.mods_data))
+        self.check_results.save()
+        updates = [u for u in collector.snapshot().values() if u is not None]
+        updates.sort(key=lambda x: x.name)
+        return updates
+
+    def update_mods(
+        self,
+        updates: list[Update],
+        on_progress: Callable[[str, int, int], None] | None = None,
+        on_finished: Callable[[str, Path | None, str], None] | None = None,
+        cancel_event: threading.Event | None = None,
+        available: Iterable[Update] = (),
+    ) -> dict[str, str]:
+        """Downloads and installs updates, a few at a time.
+
+        Downloads run in parallel, but a mod is only installed once the updates of the
+        mods it depends on have been installed, and only if the new release's
+        dependencies are met or would be by an update in available. on_progress is
+        called with (mod id, bytes downloaded, total bytes) and on_finished with
+        (mod id, installed zip path or None, error message or "").
+
+        Returns the error message of every update keyed by mod id, "" for successes.
+        """
+        # Keys are mod ids, values are error messages
+        collector = ResultCollector()
+        # Updates shown from the last check can be installed before any scan
+        if any(update.mod_id not in self.mods_data for update in updates):
+            self.populate_mods_data()
+        plan = UpdatePlan(updates, self.mods_data)
+        # Set once a mod's update has been installed or has failed
+        finished = {update.mod_id: threading.Event() for update in plan.updates}
+        # Positions in the plan, which is also the order the updates start in
+        order = {update.mod_id: i for i, update in enumerate(plan.updates)}
+        planned_ids = {mod_id.lower(): mod_id for mod_id in finished}
+        # Updates that can still meet a newer release's dependencies
+        available_updates = {u.mod_id.lower(): u for u in [*available, *plan.updates]}
+
+        def update(update_data: Update):
+            mod_id = update_data.mod_id
+            zip_path = None
+            error = ""
+
+            def before_install(part_path: Path):
+                dependencies = get_dependencies(get_mod_info_from_zip(part_path))
+                waits_for = set(plan.dependencies[mod_id])
+                for dependency in dependencies:
+                    dependency_id = planned_ids.get(dependency)
+                    # Only updates that started earlier, as later ones may be queued
+                    # behind this one; mods in a cycle don't wait for each other
+                    if (
+                        dependency_id is not None
+                        and order[dependency_id] < order[mod_id]
+                        and dependency_id not in plan.cycles.get(mod_id, ())
+                    ):
+                        waits_for.add(dependency_id)
+                # Updates run in topological order, so these have already started
+                for dependency_id in waits_for:
+                    finished[dependency_id].wait()
+                self.check_dependencies(mod_id, dependencies, available_updates)
+
+            if cancel_event is not None and cancel_event.is_set():
+                error = "Cancelled"
+            else:
+                try:
+                    zip_path = self.update_mod(
+                        update_data,
+                        (
+                            (lambda done, total: on_progress(mod_id, done, total))
+                            if on_progress is not None
+                            else None
+                        ),
+                        cancel_event,
+                        before_install,
+                    )
+                except Exception as ex:
+                    filename = update_data.latest_release.filename
+                    logging.critical(f"Error downloading {filename}: {ex}")
+                    error = str(ex) or type(ex).__name__
+            finished[mod_id].set()
+            collector.add(mod_id, error)
+            if on_finished is not None:
+                on_finished(mod_id, zip_path, error)
+
+        with self.diagnostics.phase("download"), self.http.cancelled_by(cancel_event):
+            with concurrent.futures.ThreadPoolExecutor(
+                MAX_DOWNLOAD_WORKERS, initializer=self.thread_initializer
+            ) as executor:
+                list(executor.map(update, plan.updates))
+        return collector.snapshot()
+
+    def plan_updates(
+        self,
+        updates: list[Update],
+        available: list[Update],
+        cancel_event: threading.Event | None = None,
+    ) -> UpdatePlan:
+        """Returns the order to install updates in, with the dependency updates needed.
+
+        Updates from available of mods that updates depend on are added to the plan.
+        The mods folder is scanned first if an update's mod hasn't been read yet.
+        """
+        if any(update.mod_id not in self.mods_data for update in updates):
+            self.populate_mods_data(cancel_event=cancel_event)
+        return UpdatePlan(updates, self.mods_data, available)
+
+    def check_dependencies(
+        self,
+        mod_id: str,
+        dependencies: dict[str, str],
+        available: dict[str, Update] | None = None,
+    ):
+        """Raises DownloadError if the installed mods don't meet a new release's needs.
+
+        Dependencies that aren't installed at all are only logged, since they can be
+        installed afterwards without touching this mod. So are ones that are too old
+        but have an update in available, keyed by lower-cased mod id, that is new
+        enough.
+        """
+        installed = {m.lower(): mod for m, mod in self.mods_data.items()}
+        for dependency, minimum in dependencies.items():
+            mod = installed.get(dependency)
+            if mod is None:
+                logging.warning(f"{mod_id} needs {dependency}, which is not installed")
+                continue
+            version = mod.version or "0"
+            if version_satisfies(version, minimum):
+                continue
+            update = (available or {}).get(dependency)
+            if update is not None and version_satisfies(update.latest_version, minimum):
+                logging.warning(
+                    f"{mod_id} needs {update.name} {minimum} or newer, but {version} "
+                    f"is installed; update it to {update.latest_version}"
+                )
+            else:
+                raise DownloadError(
+                    f"Needs {dependency} {minimum} or newer, but {version} is installed"
+                )
+
+    def update_mod(
+        self,
+        update: Update,
+        on_progress: Callable[[int, int], None] | None = None,
+        cancel_event: threading.Event | None = None,
+        before_install: Callable[[Path], None] | None = None,
+    ) -> Path:
+        """Downloads and installs one update, returning the path of the new zip.
+
+        The release is taken from the archive cache when it has it. The replaced zip and
+        the new one are both kept in the archive cache.
+        """
+        mod_id = update.mod_id
+        latest_release = update.latest_release
+        if mod_id not in self.mods_data:
+            raise DownloadError(f"{mod_id} is no longer installed")
+        old_zip_path = self.mods_data[mod_id].path
+        zip_path = old_zip_path.parent / latest_release.filename
+        part_path = old_zip_path.parent / (latest_release.filename + ".part")
+        keys = release_keys(mod_id, latest_release)
+
+        with self.diagnostics.phase("download_mod"):
+            cached = self.archive_cache.get(keys)
+            self.diagnostics.record_cache(
+                "archives", "miss" if cached is None else "hit"
+            )
+            if cached is not None:
+                cached_path, entry = cached
+                link_or_copy(cached_path, part_path)
+                if on_progress is not None:
+                    on_progress(entry["size"], entry["size"])
+            else:
+                fetch_part(
+                    self.http,
+                    latest_release.mainfile,
+                    part_path,
+                    on_progress,
+                    cancel_event,
+                )
+                self.diagnostics.add_bytes(part_path.stat().st_size)
+
+            try:
+                install_part(
+                    part_path,
+                    zip_path,
+                    old_zip_path,
+                    # Only checked when Mod DB includes them in the release
+                    latest_release.filesize,
+                    latest_release.sha256,
+                    before_install,
+                    lambda old_path: self.keep_replaced_zip(mod_id, old_path),
+                )
+            except DownloadError:
+                # A corrupt cached zip is dropped so the next attempt downloads it
+                if cached is not None:
+                    self.archive_cache.discard_if_corrupt(entry["sha256"])
+                raise
+        if cached is None:
+            self.archive_cache.put(zip_path, keys)
+        self.mods_data[mod_id].path = zip_path
+        self.mods_data[mod_id].version = update.latest_version
+        return zip_path
+
+    def keep_replaced_zip(self, mod_id: str, zip_path: Path):
+        """Puts an installed zip into the archive cache before it gets replaced."""
+        version = self.mods_data[mod_id].version
+        if version:
+            self.archive_cache.put(zip_path, [f"mod:{mod_id.lower()}@{version}"])
+
+    def cached_versions(self, mod_id: str) -> list[str]:
+        """Returns the versions of a mod in the archive cache, newest first."""
+        return sorted(
+            self.archive_cache.versions(mod_id), key=parse_version, reverse=True
+        )
+
+    def rollback_mod(self, mod_id: str, version: str) -> Path:
+        """Installs a version of a mod from the archive cache, without Mod DB.
+
+        The installed zip is kept in the archive cache, so this can be undone the same
+        way. Returns the path of the installed zip.
+        """
+        if mod_id not in self.mods_data:
+            self.populate_mods_data()
+        if mod_id not in self.mods_data:
+            raise DownloadError(f"{mod_id} is not installed")
+        cached = self.archive_cache.get([f"mod:{mod_id.lower()}@{version}"])
+        if cached is None:
+            raise DownloadError(f"{mod_id} {version} is not in the archive cache")
+
+        cached_path, entry = cached
+        old_zip_path = self.mods_data[mod_id].path
+        zip_path = old_zip_path.parent / entry["filename"]
+        part_path = old_zip_path.parent / (entry["filename"] + ".part")
+        link_or_copy(cached_path, part_path)
+        install_part(
+            part_path,
+            zip_path,
+            old_zip_path,
+            entry["size"],
+            before_replace=lambda old_path: self.keep_replaced_zip(mod_id, old_path),
+        )
+        self.mods_data[mod_id].path = zip_path
+        self.mods_data[mod_id].version = version
+        return zip_path
+
+    def fetch_release_dates(self):
+        """Fetches the bulk ModDB listing used to skip mods with no new release."""
+        # One bulk request tells which cached mod responses can still be trusted
+        try:
+            with self.diagnostics.phase("fetch"):
+                self.release_dates = self.api.get_release_dates(self.force_refresh)
+        except Exception as ex:
+            logging.warning(f"Could not fetch Mod DB listing, checking every mod: {ex}")
+            self.release_dates = {}
+
+    def last_updates(self) -> list[Update]:
+        """Returns the updates of the last check that still apply, sorted by name."""
+        return self.check_results.updates(self.current_vs_version)
+
+    def check_mod_for_update(self, mod_id: str) -> Update | None:
+        """Returns the newest update of a mod for the current VS version, if any.
+
+        The last result is reused while the mod zip is unchanged and the mod has no new
+        release.
+        """
+        zip_path = self.mods_data[mod_id].path
+        stat = zip_path.stat()
+        last_released = self.release_dates.get(mod_id.lower())
+        if not self.force_refresh:
+            entry = self.check_results.get(
+                mod_id,
+                zip_path,
+                stat,
+                self.current_vs_version,
+                last_released,
+                self.cache_ttl,
+            )
+            self.diagnostics.record_cache(
+                "last_check", "miss" if entry is None else "hit"
+            )
+            if entry is not None:
+                return entry["update"]
+
+        mod_db_info = self.fetch_mod_info(mod_id)
+        update = self.evaluate_mod(mod_id, mod_db_info)
+        # A result from a response older than the listing's last release must not be
+        # reused, or that release would never be reported
+        if self.is_behind_listing(mod_id, mod_db_info):
+            last_released = None
+        self.check_results.put(
+            mod_id, zip_path, stat, self.current_vs_version, last_released, update
+        )
+        return update
+
+    def fetch_mod_info(self, mod_id: str) -> dict:
+        """Returns the ModDB data of a mod, from the response cache if it is current."""
+        with self.diagnostics.phase("fetch"):
+            mod_db_info = self.get_unchanged_mod_info(mod_id)
+            self.diagnostics.record_cache(
+                "prefilter", "miss" if mod_db_info is None else "hit"
+            )
+            if mod_db_info is None:
+                # With a release time in the listing, a miss means the cached response
+                # lacks the newest release, so it is stale however young it is
+                mod_db_info = self.get_mod_info_from_api(
+                    mod_id, self.release_dates.get(mod_id.lower()) is not None
+                )
+        return mod_db_info
+
+    def evaluate_mod(
+        self, mod_id: str, mod_db_info: dict | None = None
+    ) -> Update | None:
+        """Picks the update of a mod from its ModDB data, fetched if not given."""
+        if mod_db_info is None:
+            mod_db_info = self.fetch_mod_info(mod_id)
+        current_mod_version = self.mods_data[mod_id].version
+        current_version_key = parse_version(current_mod_version)
+
+        with self.diagnostics.phase("evaluate"):
+            # Older releases than the installed one can't be updates
+            release_index = ReleaseIndex(mod_db_info, current_version_key)
+            found = release_index.find_update(
+                current_version_key, self.current_vs_version
+            )
+        if found is None:
+            return None
+
+        latest_mod_release, changelog = found
+        return Update(
+            mod_id,
+            release_index.name,
+            current_mod_version,
+            latest_mod_release,
+            changelog,
+        )
+
+    def compatibility_matrix(
+        self,
+        vs_versions: list[str] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> dict:
+        """Finds the newest release of every installed mod for several VS versions.
+
+        Defaults to the installed VS version and the latest one on Mod DB, or only the
+        installed one if the latest can't be fetched. Each mod's Mod DB data is fetched
+        once (usually from the response cache) and its releases are matched against
+        every VS version in a single pass. on_progress is called with (mods evaluated,
+        total mods).
+
+        Returns {"vs_versions": [...], "mods": [...]}, where each mod has a "releases"
+        entry per VS version holding the newest supporting release's version and file
+        name (or None), and whether the installed release supports it.
+        """
+        with self.http.cancelled_by(cancel_event):
+            return self._compatibility_matrix(vs_versions, on_progress, cancel_event)
+
+    def _compatibility_matrix(self, vs_versions, on_progress, cancel_event) -> dict:
+        if not vs_versions:
+            vs_versions = [self.current_vs_version]
+            try:
+                vs_versions.append(self.get_latest_game_version())
+            except Exception:
+                logging.warning(
+                    f"Comparing with VS {self.current_vs_version} only, as the latest "
+                    "version could not be fetched"
+                )
+        vs_versions = list(dict.fromkeys(vs_versions))
+        self.fetch_release_dates()
+        self.populate_mods_data(cancel_event=cancel_event)
+        collector = ResultCollector(on_progress, len(self.mods_data))
+
+        def evaluate(mod_id: str):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            mod = self.mods_data[mod_id]
+            row = {
+                "mod_id": mod_id,
+                "name": mod.name,
+                "installed_version": mod.version,
+                "releases": None,
+            }
+            try:
+                release_index = ReleaseIndex(self.fetch_mod_info(mod_id))
+                row["name"] = release_index.name
+                with self.diagnostics.phase("evaluate"):
+                    compatibility = release_index.compatibility(
+                        parse_version(mod.version or "0"), vs_versions
+                    )
+                row["releases"] = {}
+                for vs_version, (release, supported) in compatibility.items():
+                    row["releases"][vs_version] = {
+                        "version": release.version if release else None,
+                        "filename": release.filename if release else None,
+                        "installed_supported": supported,
+                    }
+            except Exception as ex:
+                logging.critical(f"Error checking mod {mod_id}: {ex}")
+            collector.add(mod_id, row)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            self.limiter.ceiling, initializer=self.thread_initializer
+        ) as executor:
+            list(executor.map(evaluate, list(self.mods_data)))
+
+        rows = sorted(collector.snapshot().values(), key=lambda row: row["name"])
+        return {"vs_versions": vs_versions, "mods": rows}
+
+    def populate_mods_data(self, on_mod_found=None, cancel_event=None) -> int:
+        """Populates mods_data for each mod in the mods folder from its modinfo.json.
+
+        Only mod folders that changed are listed when the mods folder index is live.
+        Zips that are unchanged since the last scan are read from the mod index, the
+        rest are read in parallel. on_mod_found is called with each mod id as soon as
+        its zip has been read. Returns the number of mod zips found.
+        """
+        start = time.perf_counter()
+        hits, misses = self.mod_info_cache.hits, self.mod_info_cache.misses
+        zip_paths = self.mods_index.zip_paths()
+        self.mods_data.clear()
+
+        for zip_path, mod_info in scan_mod_zips(
+            zip_paths, self.mod_info_cache, initializer=self.thread_initializer
+        ):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            # Ensure mod_info is a dict and contains 'modid'
+            if isinstance(mod_info, dict) and "modid" in mod_info:
+                # A mod installed twice is only checked once
+                is_new = mod_info["modid"] not in self.mods_data
+                self.mods_data[mod_info["modid"]] = Mod.from_mod_info(mod_info)
+                if on_mod_found is not None and is_new:
+                    on_mod_found(mod_info["modid"])
+            else:
+                logging.warning(
+                    f"modinfo.json in {zip_path} missing 'modid' key or is invalid. Skipping."
+                )
+
+        # Forget zips from deleted or changed mod folders
+        self.mod_info_cache.prune({str(zip_path) for zip_path in zip_paths})
+        self.mod_info_cache.save()
+        self.mod_count = len(zip_paths)
+
+        cache = self.mod_info_cache
+        folders = self.mods_index
+        self.diagnostics.add_phase("scan", time.perf_counter() - start)
+        self.diagnostics.record_cache("mods_folder", "hit", folders.folders_reused)
+        self.diagnostics.record_cache("mods_folder", "miss", folders.folders_read)
+        self.diagnostics.record_cache("mod_index", "hit", cache.hits - hits)
+        self.diagnostics.record_cache("mod_index", "miss", cache.misses - misses)
+        return self.mod_count
+
+    def get_latest_game_version(self):
+        """Returns the latest game version from the ModDB API."""
+        try:
+            data = self.api.get_json("/gameversions", self.force_refresh)
+            # ASSUMPTION: The last entry in the list is always the latest version
+            return data["gameversions"][-1]["name"]
+        except Exception as ex:
+            logging.critical(f"Error fetching latest game versions: {ex}")
+            raise
+
+    def get_unchanged_mod_info(self, mod_id: str) -> dict | None:
+        """Returns a mod's cached ModDB data if the bulk listing shows no newer release.
+
+        Returns None when the mod has to be fetched from the API.
+        """
+        if self.force_refresh:
+            return None
+
+        if self.release_dates.get(mod_id.lower()) is None:
+            return None
+        cached = self.api.peek_json(f"/mod/{mod_id}")
+        if cached is None or self.is_behind_listing(mod_id, cached):
+            return None
+
+        logging.debug(f"No new releases for {mod_id} since it was cached")
+        return cached
+
+    def is_behind_listing(self, mod_id: str, mod_db_info: dict) -> bool:
+        """Returns whether the bulk listing shows a release newer than mod_db_info's.
+
+        Also true when mod_db_info's newest release time is unknown, and false when the
+        listing has no release time for the mod.
+        """
+        last_released = parse_timestamp(self.release_dates.get(mod_id.lower()))
+        if last_released is None:
+            return False
+        releases = mod_db_info.get("mod", {}).get("releases") or []
+        newest = parse_timestamp(releases[0].get("created")) if releases else None
+        return newest is None or last_released > newest
+
+    def get_mod_info_from_api(self, mod_id: str, revalidate: bool = False) -> dict:
+        """Returns all data from ModDB page, revalidating a cached copy if asked to"""
+        try:
+            return self.api.get_json(f"/mod/{mod_id}", self.force_refresh, revalidate)
+        except Exception as ex:
+            logging.critical(f"Error fetching mod info: {ex}")
+            raise
@@ -0,0 +1,162 @@
+from .utils import parse_version
+
+import logging
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from .records import Mod, Update
+
+# Dependencies on the game itself rather than on another mod
+BUILTIN_MOD_IDS = {"game", "survival", "creative"}
+
+
+def get_dependencies(mod_info: dict) -> dict[str, str]:
+    """Returns the mod dependencies declared in a modinfo.json.
+
+    Keys are lower-cased mod ids and values are minimum versions, "" when any version
+    will do. Dependencies on the game are left out.
+    """
+    dependencies = mod_info.get("dependencies")
+    if not isinstance(dependencies, dict):
+        return {}
+    return {
+        mod_id.lower(): str(version or "").strip().lstrip("*")
+        for mod_id, version in dependencies.items()
+        if isinstance(mod_id, str) and mod_id.lower() not in BUILTIN_MOD_IDS
+    }
+
+
+def version_satisfies(version: str, minimum: str) -> bool:
+    return not minimum or parse_version(version) >= parse_version(minimum)
+
+
+class UpdatePlan:
+    """Orders updates so that every mod is installed after the mods it depends on.
+
+    The graph comes from the dependencies of the installed mods. Updates
+    of mods that a selected mod depends on are pulled in from available, transitively,
+    and listed in pulled_in. Updates can run in parallel as long as each one waits for
+    the updates in dependencies[mod_id] before installing. Mods in a dependency cycle
+    don't wait for each other; cycles[mod_id] holds the mods of a mod's cycle.
+    """
+
+    def __init__(
+        self,
+        updates: Iterable["Update"],
+        mods_data: dict[str, "Mod"],
+        available: Iterable["Update"] = (),
+    ):
+        # Mod ids are case-insensitive in dependency lists
+        installed_ids = {mod_id.lower(): mod_id for mod_id in mods_data}
+        available = {u.mod_id: u for u in available}
+        planned = {u.mod_id: u for u in updates}
+        self.pulled_in = []
+        self.cycles = {}
+
+        pending = list(planned)
+        while pending:
+            mod_id = pending.pop()
+            for dependency in self.installed_dependencies(mods_data, mod_id):
+                dependency_id = installed_ids.get(dependency)
+                if dependency_id in available and dependency_id not in planned:
+                    logging.info(f"Also updating {dependency_id}, needed by {mod_id}")
+                    planned[dependency_id] = available[dependency_id]
+                    self.pulled_in.append(available[dependency_id])
+                    pending.append(dependency_id)
+
+        # Keys are mod ids, values are the mod ids of planned updates to wait for
+        self.dependencies = {}
+        for mod_id in planned:
+            self.dependencies[mod_id] = {
+                installed_ids[dependency]
+                for dependency in self.installed_dependencies(mods_data, mod_id)
+                if installed_ids.get(dependency) in planned
+                and installed_ids[dependency] != mod_id
+            }
+
+        self.updates = self.sort(planned)
+
+    @staticmethod
+    def installed_dependencies(mods_data: dict[str, "Mod"], mod_id: str) -> dict:
+        mod = mods_data.get(mod_id)
+        return mod.dependencies if mod is not None else {}
+
+    def sort(self, planned: dict[str, "Update"]) -> list["Update"]:
+        """Returns the planned updates in topological order, ties broken by name.
+
+        Only the waits within a dependency cycle are dropped, so a cycle still waits for
+        the mods it depends on and the mods depending on it still wait for it.
+        """
+        for cycle in self.find_cycles():
+            logging.warning(f"Dependency cycle between {', '.join(sorted(cycle))}")
+            for mod_id in cycle:
+                self.dependencies[mod_id] -= cycle
+                self.cycles[mod_id] = cycle
+
+        dependents = {mod_id: [] for mod_id in planned}
+        remaining = {}
+        for mod_id, waits_for in self.dependencies.items():
+            remaining[mod_id] = len(waits_for)
+            for dependency_id in waits_for:
+                dependents[dependency_id].append(mod_id)
+
+        def name(mod_id: str) -> tuple[str, str]:
+            return planned[mod_id].name, mod_id
+
+        ready = sorted((m for m, count in remaining.items() if count == 0), key=name)
+        ordered = []
+        while ready:
+            mod_id = ready.pop(0)
+            ordered.append(mod_id)
+            for dependent in dependents[mod_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+            ready.sort(key=name)
+        return [planned[mod_id] for mod_id in ordered]
+
+    def find_cycles(self) -> list[frozenset[str]]:
+        """Returns the strongly connected components of the wait graph with 2+ mods."""
+        # Iterative Tarjan, as long dependency chains could exceed the recursion limit
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+        for root in self.dependencies:
+            if root in index:
+                continue
+            work = [(root, iter(self.dependencies[root]))]
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                mod_id, edges = work[-1]
+                for dependency_id in edges:
+                    if dependency_id not in index:
+                        index[dependency_id] = low[dependency_id] = len(index)
+                        stack.append(dependency_id)
+                        on_stack.add(dependency_id)
+                        work.append(
+                            (dependency_id, iter(self.dependencies[dependency_id]))
+                        )
+                        break
+                    if dependency_id in on_stack:
+                        low[mod_id] = min(low[mod_id], index[dependency_id])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[mod_id])
+                    if low[mod_id] == index[mod_id]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member == mod_id:
+                                break
+                        if len(component) > 1:
+                            cycles.append(frozenset(component))
+        return cycles
@@ -0,0 +1,136 @@
+import json
+import time
+import bisect
+import logging
+import threading
+
+from contextlib import contextmanager
+from pathlib import Path
+
+# Upper bounds of the request latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class Diagnostics:
+    """Thread-safe timings and counters for one check and the downloads that follow it.
+
+    Phases run concurrently on worker threads, so each phase reports both the number of
+    calls and their summed time; wall-clock phases ("scan", "check", "download") are
+    only ever entered once per run.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started_at = time.time()
+            # Keys are phase names, values are [calls, total seconds]
+            self.phases = {}
+            # Keys are request kinds, values are per-bucket counts (last is overflow)
+            self.histograms = {}
+            self.request_counts = {}
+            self.statuses = {}
+            self.bytes_received = 0
+            # Keys are cache names, values are counts per outcome ("hit", "miss", ...)
+            self.caches = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Adds the time spent in the with block to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def add_phase(self, name: str, seconds: float):
+        with self.lock:
+            calls, total = self.phases.get(name, (0, 0.0))
+            self.phases[name] = [calls + 1, total + seconds]
+
+    def record_request(self, kind: str, seconds: float, status: int, size: int = 0):
+        """Records the latency, status and body size of one HTTP request."""
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        with self.lock:
+            histogram = self.histograms.setdefault(
+                kind, [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            )
+            histogram[bucket] += 1
+            self.request_counts[kind] = self.request_counts.get(kind, 0) + 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_received += size
+
+    def add_bytes(self, size: int):
+        with self.lock:
+            self.bytes_received += size
+
+    def record_cache(self, name: str, outcome: str, count: int = 1):
+        """Counts a cache lookup; outcomes other than "miss" count as hits."""
+        with self.lock:
+            outcomes = self.caches.setdefault(name, {})
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+
+    def report(self) -> dict:
+        """Returns everything recorded so far as a JSON-friendly dictionary."""
+        with self.lock:
+            caches = {}
+            for name, outcomes in self.caches.items():
+                total = sum(outcomes.values())
+                hits = total - outcomes.get("miss", 0)
+                caches[name] = {**outcomes, "hit_rate": hits / total if total else None}
+
+            return {
+                "started_at": self.started_at,
+                "phases": {
+                    name: {"calls": calls, "total_s": round(total, 4)}
+                    for name, (calls, total) in self.phases.items()
+                },
+                "requests": {
+                    kind: {
+                        "count": self.request_counts[kind],
+                        "latency_ms_buckets": dict(
+                            zip(
+                                [f"<={b}" for b in LATENCY_BUCKETS_MS] + ["more"],
+                                histogram,
+                            )
+                        ),
+                    }
+                    for kind, histogram in self.histograms.items()
+                },
+                "statuses": {str(k): v for k, v in self.statuses.items()},
+                "bytes_received": self.bytes_received,
+                "caches": caches,
+            }
+
+    @staticmethod
+    def summarize(report: dict) -> str:
+        """Returns a short human-readable summary of a report."""
+        lines = []
+        for name, phase in report["phases"].items():
+            lines.append(
+                f"{name}: {phase['total_s'] * 1000:.0f} ms "
+                f"over {phase['calls']} call(s)"
+            )
+        for kind, requests in report["requests"].items():
+            buckets = ", ".join(
+                f"{bucket}: {count}"
+                for bucket, count in requests["latency_ms_buckets"].items()
+                if count
+            )
+            lines.append(f"{kind} requests: {requests['count']} ({buckets} ms)")
+        lines.append(f"Received {report['bytes_received'] / 1024:.0f} KiB")
+        for name, cache in report["caches"].items():
+            if cache["hit_rate"] is not None:
+                lines.append(f"{name} hit rate: {cache['hit_rate']:.0%}")
+        return "\n".join(lines)
+
+    def write(self, path: Path, report: dict | None = None):
+        """Writes a report (the current one by default) to a JSON file."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as report_file:
+                json.dump(report or self.report(), report_file, indent=2)
+        except Exception as ex:
+            logging.warning(f"Could not write diagnostics report {path}: {ex}")
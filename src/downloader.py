@@ -0,0 +1,192 @@
+from .mod_index import get_mod_info_from_zip
+from .net import HttpClient, HttpError
+
+import os
+import re
+import hashlib
+import logging
+import zipfile
+import threading
+import http.client
+
+from pathlib import Path
+from typing import Callable
+
+# Size of each read from the download stream; memory use stays at one chunk per download
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Number of mods downloaded at once
+MAX_DOWNLOAD_WORKERS = 4
+# Times a download cut off mid-stream is resumed before giving up; the ".part" file is
+# kept after that so the next update picks up where this one stopped
+MAX_RESUME_ATTEMPTS = 3
+
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadError(Exception):
+    """Raised when a downloaded mod can't be installed."""
+
+
+def fetch_part(
+    client: HttpClient,
+    download_url: str,
+    part_path: Path,
+    on_progress: Callable[[int, int], None] | None = None,
+    cancel_event: threading.Event | None = None,
+):
+    """Downloads a file to part_path, resuming what an earlier attempt left there.
+
+    A stream that breaks off is resumed with a Range request up to MAX_RESUME_ATTEMPTS
+    times. The part file is kept when this fails or is cancelled, for the next attempt.
+    """
+    download_url = download_url.replace(" ", "%20")
+    logging.debug(f"Downloading {part_path.name} from {download_url}")
+    attempt = 0
+    while True:
+        try:
+            complete = download_part(
+                client, download_url, part_path, on_progress, cancel_event
+            )
+        except (OSError, http.client.HTTPException) as ex:
+            if attempt >= MAX_RESUME_ATTEMPTS:
+                raise
+            attempt += 1
+            logging.debug(f"Resuming {part_path.name} after error: {ex}")
+            continue
+        if complete:
+            return
+        if attempt >= MAX_RESUME_ATTEMPTS:
+            raise DownloadError(f"Download of {part_path.name} stopped early")
+        attempt += 1
+        logging.debug(f"Resuming {part_path.name} after a short response")
+
+
+def install_part(
+    part_path: Path,
+    zip_path: Path,
+    old_zip_path: Path,
+    expected_size: int | None = None,
+    expected_sha256: str | None = None,
+    before_install: Callable[[Path], None] | None = None,
+    before_replace: Callable[[Path], None] | None = None,
+) -> Path:
+    """Verifies a complete part file and swaps it in for the old zip.
+
+    Only once the file passes verify_download is it moved into place and the old zip
+    removed. before_install is called with the verified file just before that and can
+    raise to keep the old zip. before_replace is called with the old zip right before it
+    is replaced or deleted. The part file is deleted if anything fails.
+
+    Returns zip_path.
+    """
+    try:
+        verify_download(part_path, expected_size, expected_sha256)
+        if before_install is not None:
+            before_install(part_path)
+        if before_replace is not None and old_zip_path.exists():
+            before_replace(old_zip_path)
+        # Atomic when the new release has the same file name as the old one
+        os.replace(part_path, zip_path)
+    except BaseException:
+        # A bad file would only be resumed into another bad file
+        part_path.unlink(missing_ok=True)
+        raise
+
+    logging.info(f"Installed {zip_path.name} to {zip_path}")
+    if zip_path != old_zip_path:
+        logging.debug(f"Deleting old mod zip: {old_zip_path}")
+        old_zip_path.unlink(missing_ok=True)
+    return zip_path
+
+
+def download_part(
+    client: HttpClient,
+    download_url: str,
+    part_path: Path,
+    on_progress: Callable[[int, int], None] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> bool:
+    """Downloads to part_path, resuming from its current size when it already exists.
+
+    Returns whether the whole file has been downloaded, as far as the response headers
+    tell. Raises DownloadError if cancelled; the part file is kept either way.
+    """
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    try:
+        with client.stream(download_url, headers) as response:
+            length = int(response.headers.get("Content-Length") or 0)
+            content_range = CONTENT_RANGE_PATTERN.fullmatch(
+                response.headers.get("Content-Range") or ""
+            )
+            if response.status == 206 and content_range is not None:
+                if int(content_range[1]) != offset:
+                    part_path.unlink()
+                    raise DownloadError(
+                        f"Server resumed {part_path.name} at the wrong byte"
+                    )
+                total = int(content_range[3]) if content_range[3] != "*" else 0
+                mode = "ab"
+            else:
+                # The server ignored the Range header and sent the whole file
+                offset = 0
+                total = length
+                mode = "wb"
+            if offset:
+                logging.debug(f"Resuming {part_path.name} at {offset}/{total} bytes")
+
+            done = offset
+            with open(part_path, mode) as out_file:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise DownloadError("Download cancelled")
+                    out_file.write(chunk)
+                    done += len(chunk)
+                    if on_progress is not None:
+                        on_progress(done, total)
+    except HttpError as ex:
+        if ex.status != 416 or not offset:
+            raise
+        # The part file doesn't fit the file on the server any more
+        logging.debug(f"Discarding {part_path.name}, the server refused to resume it")
+        part_path.unlink()
+        return False
+
+    if total and done > total:
+        raise DownloadError(f"Expected {total} bytes but got {done}")
+    return not total or done == total
+
+
+def verify_download(
+    part_path: Path,
+    expected_size: int | None = None,
+    expected_sha256: str | None = None,
+):
+    """Raises DownloadError unless a downloaded file is an intact mod zip.
+
+    The size and SHA-256 hash are checked when the release metadata has them, then the
+    CRC of every zip member and finally modinfo.json.
+    """
+    size = part_path.stat().st_size
+    if expected_size and size != expected_size:
+        raise DownloadError(f"Expected {expected_size} bytes but got {size}")
+
+    if expected_sha256:
+        sha256 = hashlib.sha256()
+        with open(part_path, "rb") as part_file:
+            while chunk := part_file.read(1024 * 1024):
+                sha256.update(chunk)
+        if sha256.hexdigest() != expected_sha256.lower():
+            raise DownloadError(f"{part_path.name} doesn't match its SHA-256 hash")
+
+    try:
+        with zipfile.ZipFile(part_path) as zip_ref:
+            bad_member = zip_ref.testzip()
+    except (zipfile.BadZipFile, OSError) as ex:
+        raise DownloadError(f"{part_path.name} is not a valid zip file: {ex}")
+    if bad_member is not None:
+        raise DownloadError(f"{bad_member} in {part_path.name} fails its CRC check")
+
+    mod_info = get_mod_info_from_zip(part_path)
+    if "modid" not in mod_info:
+        raise DownloadError(f"{part_path.name} has no readable modinfo.json")
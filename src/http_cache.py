@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from pathlib import Path
+
+
+class ResponseCache:
+    """Size-bounded on-disk cache of API responses.
+
+    Each response is stored in its own file along with the validators (ETag and
+    Last-Modified) needed to revalidate it. When the cache grows past max_bytes, the
+    least recently used responses are evicted.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        # Keys are cache file names, values are [size, last access time]
+        self.files = {}
+        self.total_bytes = 0
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for file in self.cache_dir.glob("*.json"):
+                stat = file.stat()
+                self.files[file.name] = [stat.st_size, stat.st_mtime]
+                self.total_bytes += stat.st_size
+        except Exception as ex:
+            logging.warning(f"Could not read response cache {self.cache_dir}: {ex}")
+
+    @staticmethod
+    def file_name(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json"
+
+    def get(self, url: str) -> dict | None:
+        """Returns the cached entry for a url, or None if there is none.
+
+        Entries hold the "body" text, its "etag" and "last_modified" validators and the
+        "fetched_at" time it was last confirmed fresh.
+        """
+        name = self.file_name(url)
+        with self.lock:
+            if name not in self.files:
+                return None
+            try:
+                with open(self.cache_dir / name, "r", encoding="utf-8") as cache_file:
+                    entry = json.load(cache_file)
+                now = time.time()
+                # File mtime doubles as the last access time for eviction
+                os.utime(self.cache_dir / name, (now, now))
+                self.files[name][1] = now
+            except Exception as ex:
+                logging.warning(f"Dropping unreadable cached response for {url}: {ex}")
+                self._remove(name)
+                return None
+
+        # Guard against hash collisions
+        return entry if entry.get("url") == url else None
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        """Stores a freshly fetched response."""
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "body": body,
+        }
+        self._write(url, entry)
+
+    def touch(self, url: str, entry: dict):
+        """Marks a cached response as fresh again after a successful revalidation."""
+        entry["fetched_at"] = time.time()
+        self._write(url, entry)
+
+    def _write(self, url: str, entry: dict):
+        name = self.file_name(url)
+        data = json.dumps(entry).encode("utf-8")
+        with self.lock:
+            try:
+                tmp_path = self.cache_dir / (name + ".tmp")
+                with open(tmp_path, "wb") as cache_file:
+                    cache_file.write(data)
+                os.replace(tmp_path, self.cache_dir / name)
+            except Exception as ex:
+                logging.warning(f"Could not cache response for {url}: {ex}")
+                return
+
+            if name in self.files:
+                self.total_bytes -= self.files[name][0]
+            self.files[name] = [len(data), time.time()]
+            self.total_bytes += len(data)
+            self._evict()
+
+    def _evict(self):
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        if self.total_bytes <= self.max_bytes:
+            return
+        for name, _ in sorted(self.files.items(), key=lambda item: item[1][1]):
+            if self.total_bytes <= self.max_bytes:
+                break
+            self._remove(name)
+
+    def _remove(self, name: str):
+        size, _ = self.files.pop(name)
+        self.total_bytes -= size
+        try:
+            (self.cache_dir / name).unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as ex:
+            logging.warning(f"Could not remove cached response {name}: {ex}")
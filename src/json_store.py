@@ -0,0 +1,41 @@
+import os
+import json
+import logging
+
+from pathlib import Path
+
+
+def load_versioned_json(path: Path, version: int, description: str) -> dict | None:
+    """Returns what save_versioned_json stored at path.
+
+    None is returned if the file is missing, unreadable or of another format version;
+    unreadable files are logged as description.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        logging.warning(f"Could not read {description} {path}: {ex}")
+        return None
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    return data
+
+
+def save_versioned_json(path: Path, version: int, data: dict, description: str) -> bool:
+    """Writes data with its format version, replacing path only once it is complete.
+
+    Returns whether it was written; failures are logged as description.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"version": version, **data}, file)
+        os.replace(tmp_path, path)
+    except Exception as ex:
+        logging.warning(f"Could not write {description} {path}: {ex}")
+        return False
+    return True
@@ -0,0 +1,271 @@
+from .utils import fix_json_string
+from .json_store import load_versioned_json, save_versioned_json
+
+import os
+import json
+import zipfile
+import logging
+import threading
+import concurrent.futures
+
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+# Upper bound on archives read at once; scanning is mostly disk bound
+MAX_SCAN_WORKERS = 8
+# modinfo.json fields the updater uses; the rest are dropped when a zip is read
+MOD_INFO_KEYS = {"modid", "name", "version", "dependencies"}
+
+
+class ModInfoCache:
+    """On-disk index of parsed modinfo.json files.
+
+    Entries are keyed by zip path and are only reused while the zip's size and
+    modification time are unchanged, so a scan of an unchanged modlist never has to
+    open a zip file.
+    """
+
+    # Bump when the stored layout changes so stale indexes are discarded
+    FORMAT_VERSION = 2
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        # Keys are zip paths as strings, values are {"size", "mtime_ns", "mod_info"}
+        self.entries = {}
+        self.dirty = False
+        # Lookups since the index was loaded
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        """Loads the index from disk, starting empty if it is missing or unreadable."""
+        data = load_versioned_json(self.cache_path, self.FORMAT_VERSION, "mod index")
+        if data is not None:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        """Writes the index to disk if anything changed since it was loaded."""
+        if not self.dirty:
+            return
+        if save_versioned_json(
+            self.cache_path,
+            self.FORMAT_VERSION,
+            {"entries": self.entries},
+            "mod index",
+        ):
+            self.dirty = False
+
+    def get(self, zip_path: Path, stat: os.stat_result) -> dict | None:
+        """Returns the cached modinfo for a zip, or None if it was added or changed.
+
+        An empty dict is returned for zips that are known not to hold a valid
+        modinfo.json.
+        """
+        entry = self.entries.get(str(zip_path))
+        if (
+            entry is None
+            or entry["size"] != stat.st_size
+            or entry["mtime_ns"] != stat.st_mtime_ns
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        mod_info = dict(entry["mod_info"])
+        if mod_info:
+            mod_info["path"] = zip_path
+        return mod_info
+
+    def put(self, zip_path: Path, stat: os.stat_result, mod_info: dict):
+        """Stores the parsed modinfo for a zip, without the non-serializable path."""
+        self.entries[str(zip_path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "mod_info": {k: v for k, v in mod_info.items() if k != "path"},
+        }
+        self.dirty = True
+
+    def prune(self, seen_paths: set[str]):
+        """Drops entries for zips that were not seen in the latest scan."""
+        stale = [path for path in self.entries if path not in seen_paths]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self.dirty = True
+
+
+def find_mod_zips(mods_path: Path) -> list[Path]:
+    """Returns the mod zip of each mod folder, which is the first zip found in it."""
+    zip_paths = []
+    for folder in mods_path.iterdir():
+        if folder.is_dir():
+            zip_path = find_folder_zip(folder)
+            if zip_path is not None:
+                zip_paths.append(zip_path)
+    return zip_paths
+
+
+def find_folder_zip(folder: Path) -> Path | None:
+    """Returns the first zip found in a mod folder, or None."""
+    try:
+        for file in folder.iterdir():
+            if file.suffix.lower() == ".zip":
+                return file
+    except OSError as ex:
+        logging.warning(f"Could not list mod folder {folder}: {ex}")
+    return None
+
+
+class ModsFolderIndex:
+    """Mod zip of every mod folder, kept up to date from file system change events.
+
+    Until live is set, every call to zip_paths lists the whole mods folder, as
+    find_mod_zips does. Once a watcher reports changes through changed(), only the
+    folders it named are listed again; a change to the mods folder itself re-lists its
+    top level, reading only folders that were added.
+    """
+
+    def __init__(self, mods_path: Path):
+        self.mods_path = mods_path
+        # Set while a watcher reports every change under mods_path
+        self.live = False
+        # Keys are mod folder names, values are their zip or None
+        self.folders = None
+        # Folder names to list again, and whether the top level has to be listed again
+        self.dirty = set()
+        self.top_dirty = False
+        # Change events received, to tell whether anything changed over a period
+        self.changes = 0
+        # Folders listed and reused by the last call to zip_paths
+        self.folders_read = 0
+        self.folders_reused = 0
+        self.lock = threading.Lock()
+
+    def changed(self, path: Path):
+        """Marks the mods folder or one of its mod folders as changed."""
+        path = Path(path)
+        with self.lock:
+            self.changes += 1
+            if path == self.mods_path:
+                self.top_dirty = True
+            elif path.parent == self.mods_path:
+                self.dirty.add(path.name)
+            else:
+                self.folders = None
+
+    def invalidate(self):
+        """Makes the next call to zip_paths list the whole mods folder."""
+        with self.lock:
+            self.folders = None
+
+    def zip_paths(self) -> list[Path]:
+        """Returns the mod zip of each mod folder, listing only folders that changed."""
+        with self.lock:
+            if not self.live or self.folders is None:
+                self.folders = {}
+                self.top_dirty = True
+                self.dirty.clear()
+            folders = self.folders
+            to_read = self.dirty
+            self.dirty = set()
+            if self.top_dirty:
+                self.top_dirty = False
+                names = {f.name for f in self.mods_path.iterdir() if f.is_dir()}
+                for name in [n for n in folders if n not in names]:
+                    del folders[name]
+                to_read |= names - folders.keys()
+
+            self.folders_read = 0
+            for name in to_read:
+                folder = self.mods_path / name
+                if folder.is_dir():
+                    folders[name] = find_folder_zip(folder)
+                    self.folders_read += 1
+                else:
+                    # Removed or renamed; a rename also marks the new name
+                    folders.pop(name, None)
+            self.folders_reused = len(folders) - self.folders_read
+            return [zip_path for zip_path in folders.values() if zip_path is not None]
+
+
+def get_mod_info_from_zip(zip_path: Path) -> dict:
+    """Returns modinfo.json from mod zip as a dictionary.
+
+    Only the zip's central directory is read to locate modinfo.json, and that is the
+    only member that gets decompressed.
+    """
+    mod_info = {}
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            # Direct lookup instead of scanning namelist()
+            try:
+                member = zip_ref.getinfo("modinfo.json")
+            except KeyError:
+                logging.critical(f"Warning: modinfo.json not found in {zip_path.name}")
+                return mod_info
+
+            # Use fix_json_string to ensure the JSON is valid
+            json_str = zip_ref.read(member).decode("utf-8")
+            json_str = fix_json_string(json_str)
+
+            mod_info = json.loads(json_str)
+            mod_info = {
+                k.lower(): v for k, v in mod_info.items() if k.lower() in MOD_INFO_KEYS
+            }
+            mod_info["path"] = zip_path
+
+    except zipfile.BadZipFile:
+        logging.critical(f"Error: {zip_path.name} is not a valid zip file")
+    except json.JSONDecodeError:
+        logging.critical(
+            f"Error: Invalid JSON in modinfo.json from {zip_path.name}; could not update the mod. Report this to the mod author."
+        )
+    except Exception as ex:
+        logging.critical(f"Error processing {zip_path.name}: {ex}")
+
+    return mod_info
+
+
+def scan_mod_zips(
+    zip_paths: Iterable[Path],
+    cache: ModInfoCache | None = None,
+    max_workers: int = MAX_SCAN_WORKERS,
+    initializer: Callable[[], None] | None = None,
+) -> Iterator[tuple[Path, dict]]:
+    """Yields (zip_path, mod_info) for each mod zip as soon as it has been read.
+
+    Zips found in the cache are yielded right away, the rest are read in a bounded
+    worker pool, whose threads first run initializer, and yielded in the order they
+    finish. The cache is only touched from the calling thread.
+    """
+    to_read = []
+    for zip_path in zip_paths:
+        try:
+            stat = zip_path.stat()
+        except OSError as ex:
+            # Removed since the mods folder was listed
+            logging.warning(f"Could not read {zip_path}: {ex}")
+            continue
+        mod_info = cache.get(zip_path, stat) if cache is not None else None
+        if mod_info is None:
+            to_read.append((zip_path, stat))
+        else:
+            yield zip_path, mod_info
+
+    if not to_read:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(to_read)), initializer=initializer
+    ) as executor:
+        futures = {
+            executor.submit(get_mod_info_from_zip, zip_path): (zip_path, stat)
+            for zip_path, stat in to_read
+        }
+        for future in concurrent.futures.as_completed(futures):
+            zip_path, stat = futures[future]
+            mod_info = future.result()
+            if cache is not None:
+                cache.put(zip_path, stat, mod_info)
+            yield zip_path, mod_info
@@ -0,0 +1,94 @@
+from .http_cache import ResponseCache
+from .net import HttpClient
+from .diagnostics import Diagnostics
+
+import json
+import time
+import logging
+
+
+class ModDBApi:
+    """Fetches JSON from the Vintage Story Mod DB API through a ResponseCache.
+
+    Cached responses younger than ttl seconds are returned without touching the network.
+    Older ones are revalidated with If-None-Match / If-Modified-Since, so an unchanged
+    response only costs a 304.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        client: HttpClient,
+        cache: ResponseCache,
+        ttl: float,
+        diagnostics: Diagnostics | None = None,
+    ):
+        self.base_url = base_url
+        self.client = client
+        self.diagnostics = diagnostics or Diagnostics()
+        self.cache = cache
+        self.ttl = ttl
+
+    def get_json(
+        self, path: str, force_refresh: bool = False, revalidate: bool = False
+    ) -> dict:
+        """Returns the parsed JSON response for an API path such as "/mod/{id}".
+
+        force_refresh skips the cache and always downloads the full response.
+        revalidate asks the server about a cached response however young it is.
+        """
+        url = f"{self.base_url}{path}"
+        entry = None if force_refresh else self.cache.get(url)
+
+        if (
+            entry is not None
+            and not revalidate
+            and time.time() - entry["fetched_at"] < self.ttl
+        ):
+            self.diagnostics.record_cache("api_cache", "hit")
+            return self.parse(entry["body"])
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.client.get(url, headers)
+        if response.status == 304 and entry is not None:
+            logging.debug(f"Cached response for {url} is still valid")
+            self.diagnostics.record_cache("api_cache", "revalidated")
+            self.cache.touch(url, entry)
+            return self.parse(entry["body"])
+
+        self.diagnostics.record_cache("api_cache", "miss")
+        body = response.body.decode("utf-8")
+        data = self.parse(body)
+        self.cache.put(
+            url,
+            body,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        return data
+
+    def peek_json(self, path: str) -> dict | None:
+        """Returns the cached JSON for an API path regardless of its age, if any."""
+        entry = self.cache.get(f"{self.base_url}{path}")
+        return self.parse(entry["body"]) if entry is not None else None
+
+    def parse(self, body: str) -> dict:
+        with self.diagnostics.phase("parse"):
+            return json.loads(body)
+
+    def get_release_dates(self, force_refresh: bool = False) -> dict[str, str]:
+        """Returns when each mod last had a release, from the bulk "/mods" listing.
+
+        Keys are lower-cased mod id strings and values are ModDB timestamps.
+        """
+        release_dates = {}
+        for mod in self.get_json("/mods", force_refresh).get("mods", []):
+            for modidstr in mod.get("modidstrs") or []:
+                release_dates[modidstr.lower()] = mod.get("lastreleased")
+        return release_dates
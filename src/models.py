@@ -0,0 +1,262 @@
+from .records import Update
+from .search import SearchIndex, update_texts
+
+import PyQt6.QtCore as QtCore  # type: ignore
+
+from PyQt6.QtCore import Qt, QModelIndex  # type: ignore
+
+
+class UpdatesModel(QtCore.QAbstractItemModel):
+    """Tree model of found updates whose changelog rows are only built when expanded.
+
+    Top-level rows are updates, with a checkbox and the mod id under UserRole in the
+    first column. Their changelog children are created through canFetchMore/fetchMore
+    the first time a row is expanded.
+    """
+
+    HEADERS = ["Name", "Version"]
+
+    def __init__(self, parent=None):
+        super(UpdatesModel, self).__init__(parent)
+        self.updates = []
+        # Keys are mod ids
+        self.checked = {}
+        # Text shown instead of the version column, e.g. download progress
+        self.status = {}
+        # Changelog rows as (changelog html, version html), only set once fetched
+        self.children = {}
+        # Child indexes store their parent's serial as internal id; 0 means top-level
+        self.serials = {}
+        self.serial_rows = {}
+        self.next_serial = 1
+        # Names, mod ids and changelog text of the listed updates, for filtering
+        self.search_index = SearchIndex()
+
+    def clear(self):
+        self.beginResetModel()
+        self.updates.clear()
+        self.checked.clear()
+        self.status.clear()
+        self.children.clear()
+        self.serials.clear()
+        self.serial_rows.clear()
+        self.search_index.clear()
+        self.endResetModel()
+
+    def insert_update(self, row: int, update: Update):
+        """Inserts an update as a checked top-level row."""
+        mod_id = update.mod_id
+        self.search_index.add(mod_id, update_texts(update))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.updates.insert(row, update)
+        self.checked[mod_id] = True
+        self.serials[mod_id] = self.next_serial
+        self.next_serial += 1
+        self.update_serial_rows()
+        self.endInsertRows()
+
+    def remove_update(self, mod_id: str):
+        row = self.row_of(mod_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.updates[row]
+        for mapping in (self.checked, self.status, self.children, self.serials):
+            mapping.pop(mod_id, None)
+        self.search_index.remove(mod_id)
+        self.update_serial_rows()
+        self.endRemoveRows()
+
+    def update_serial_rows(self):
+        self.serial_rows = {
+            self.serials[update.mod_id]: row for row, update in enumerate(self.updates)
+        }
+
+    def row_of(self, mod_id: str) -> int:
+        """Returns the row of a mod's update, or -1 if it isn't listed."""
+        serial = self.serials.get(mod_id)
+        return self.serial_rows.get(serial, -1)
+
+    def checked_mod_ids(self) -> list[str]:
+        """Returns the mod ids of checked updates in row order."""
+        return [u.mod_id for u in self.updates if self.checked[u.mod_id]]
+
+    def set_checked(self, mod_ids: list[str], checked: bool):
+        """Checks or unchecks the updates of several mods at once."""
+        rows = [self.row_of(mod_id) for mod_id in mod_ids]
+        rows = [row for row in rows if row >= 0]
+        if not rows:
+            return
+        for row in rows:
+            self.checked[self.updates[row].mod_id] = checked
+        self.dataChanged.emit(
+            self.index(min(rows), 0),
+            self.index(max(rows), 0),
+            [Qt.ItemDataRole.CheckStateRole],
+        )
+
+    def set_status(self, mod_id: str, text: str | None):
+        """Replaces an update's version column with text, or restores it if None."""
+        row = self.row_of(mod_id)
+        if row < 0:
+            return
+        if text is None:
+            self.status.pop(mod_id, None)
+        else:
+            self.status[mod_id] = text
+        version_index = self.index(row, 1)
+        self.dataChanged.emit(version_index, version_index)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        mod_id = self.updates[parent.row()].mod_id
+        return self.createIndex(row, column, self.serials[mod_id])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        row = self.serial_rows.get(index.internalId(), -1)
+        if row < 0:
+            return QModelIndex()
+        return self.createIndex(row, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.updates)
+        if parent.internalId() != 0 or parent.column() != 0:
+            return 0
+        return len(self.children.get(self.updates[parent.row()].mod_id, ()))
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.updates)
+        if parent.internalId() != 0 or parent.column() != 0:
+            return False
+        return bool(self.updates[parent.row()].changelog)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalId() != 0 or parent.column() != 0:
+            return False
+        return self.updates[parent.row()].mod_id not in self.children
+
+    def fetchMore(self, parent):
+        """Builds the changelog rows of an update."""
+        if not self.canFetchMore(parent):
+            return
+        update = self.updates[parent.row()]
+        children = []
+        # Add change log for each release since the current version
+        for version, changelog_text in update.changelog:
+            children.append(
+                (
+                    changelog_text or "<i>No changelog found.</i>",
+                    f"<div style='text-align:center;'><i>{version}</i></div>",
+                )
+            )
+        if not children:
+            self.children[update.mod_id] = children
+            return
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        self.children[update.mod_id] = children
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if index.internalId() != 0:
+            row = self.serial_rows.get(index.internalId(), -1)
+            if role != Qt.ItemDataRole.DisplayRole or row < 0:
+                return None
+            update = self.updates[row]
+            return self.children[update.mod_id][index.row()][index.column()]
+
+        update = self.updates[index.row()]
+        mod_id = update.mod_id
+        if index.column() == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return update.name
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return (
+                    Qt.CheckState.Checked
+                    if self.checked[mod_id]
+                    else Qt.CheckState.Unchecked
+                )
+            if role == Qt.ItemDataRole.UserRole:
+                return mod_id
+        elif role == Qt.ItemDataRole.DisplayRole:
+            if mod_id in self.status:
+                return self.status[mod_id]
+            return f"{update.current_version} → {update.latest_version}"
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (
+            role != Qt.ItemDataRole.CheckStateRole
+            or not index.isValid()
+            or index.internalId() != 0
+            or index.column() != 0
+        ):
+            return False
+        # Views pass the check state as an int
+        checked = value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
+        self.checked[self.updates[index.row()].mod_id] = checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled
+        if index.internalId() == 0:
+            flags |= Qt.ItemFlag.ItemIsSelectable
+            if index.column() == 0:
+                flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif index.column() == 0:
+            # Changelog version column isn't selectable
+            flags |= Qt.ItemFlag.ItemIsSelectable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+
+class UpdatesFilterModel(QtCore.QSortFilterProxyModel):
+    """Shows the updates matching a search query, looked up in the source's index.
+
+    Changelog rows are shown whenever their update is, and loaded lazily as before.
+    """
+
+    def __init__(self, parent=None):
+        super(UpdatesFilterModel, self).__init__(parent)
+        self.query = ""
+
+    def set_query(self, query: str):
+        self.query = query
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if source_parent.isValid():
+            return True
+        source = self.sourceModel()
+        # Cached by the index until the query or the updates change
+        matches = source.search_index.search(self.query)
+        return matches is None or source.updates[source_row].mod_id in matches
+
+    def visible_mod_ids(self) -> list[str]:
+        """Returns the mod ids of the updates shown, in row order."""
+        return [
+            self.index(row, 0).data(Qt.ItemDataRole.UserRole)
+            for row in range(self.rowCount())
+        ]
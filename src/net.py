@@ -0,0 +1,307 @@
+from .diagnostics import Diagnostics
+from .scheduler import AdaptiveLimiter
+
+import gzip
+import time
+import random
+import logging
+import threading
+import http.client
+import email.utils
+
+from contextlib import contextmanager
+from typing import Iterator
+from urllib.parse import urljoin, urlsplit
+
+# Seconds a connect or read may block before the request fails
+DEFAULT_TIMEOUT = 30
+# Retries after the first attempt for connection errors, 429 and 5xx responses
+MAX_RETRIES = 4
+# Backoff before retry n is a random delay up to BACKOFF_BASE * 2^n, at most BACKOFF_MAX
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30
+MAX_REDIRECTS = 5
+USER_AGENT = "MO2-VS-Mod-Updater"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# What a pooled connection that the server closed while idle fails with on reuse
+STALE_CONNECTION_ERRORS = (
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class HttpError(Exception):
+    """Raised for responses that are not successful after all retries."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class HttpResponse:
+    """A fully read response."""
+
+    def __init__(self, status: int, headers: http.client.HTTPMessage, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class HttpClient:
+    """Thread-safe HTTP client that keeps connections alive between requests.
+
+    Up to pool_size idle connections are kept per host, so sizing it to the number of
+    worker threads lets every worker reuse its TCP and TLS session. Connection errors,
+    429 and 5xx responses are retried with jittered exponential backoff, honouring
+    Retry-After when the server sends it. A pooled connection that turns out to have
+    been closed by the server is replaced at once, without counting as a retry. With a
+    limiter, every request holds one of its slots until its body has been read, and
+    every response adjusts its limit. Waits between retries end early, and no further
+    retries are made, once the event given to cancelled_by is set.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        diagnostics: Diagnostics | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ):
+        self.pool_size = pool_size
+        # Bounds requests in flight, including streamed downloads, across all threads
+        self.limiter = limiter
+        self.diagnostics = diagnostics
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.lock = threading.Lock()
+        # Keys are (scheme, host), values are lists of idle connections
+        self.idle = {}
+        # Set while an operation that can be cancelled runs; see cancelled_by
+        self.cancel_event = None
+
+    @contextmanager
+    def cancelled_by(self, cancel_event: threading.Event | None) -> Iterator[None]:
+        """Stops retrying requests made within the block once cancel_event is set."""
+        self.cancel_event = cancel_event
+        try:
+            yield
+        finally:
+            self.cancel_event = None
+
+    def get(self, url: str, headers: dict | None = None) -> HttpResponse:
+        """Sends a GET request and reads the whole response.
+
+        Returns 2xx and 304 responses, raises HttpError for anything else.
+        """
+        headers = {"Accept-Encoding": "gzip", **(headers or {})}
+        start = time.perf_counter()
+        url, conn, response = self._request(url, headers)
+        try:
+            body = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        finally:
+            self._release_slot()
+        self._release(url, conn, response)
+        if self.diagnostics is not None:
+            self.diagnostics.record_request(
+                "api", time.perf_counter() - start, response.status, len(body)
+            )
+
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        if not (200 <= response.status < 300 or response.status == 304):
+            raise HttpError(response.status, url)
+        return HttpResponse(response.status, response.headers, body)
+
+    @contextmanager
+    def stream(
+        self, url: str, headers: dict | None = None
+    ) -> Iterator[http.client.HTTPResponse]:
+        """Sends a GET request and yields the unread response for streaming.
+
+        Raises HttpError for non-2xx responses. The connection goes back to the pool if
+        the body was read to the end.
+        """
+        start = time.perf_counter()
+        url, conn, response = self._request(url, headers or {})
+        # Latency to the response headers; the body size is counted by the caller
+        if self.diagnostics is not None:
+            self.diagnostics.record_request(
+                "download", time.perf_counter() - start, response.status
+            )
+        try:
+            if not 200 <= response.status < 300:
+                conn.close()
+                raise HttpError(response.status, url)
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        finally:
+            self._release_slot()
+        if response.isclosed():
+            self._release(url, conn, response)
+        else:
+            conn.close()
+
+    def _request(
+        self, url: str, headers: dict
+    ) -> tuple[str, http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Returns the final url, connection and response, after retries and redirects.
+
+        The limiter slot of the returned response is still held; the caller releases it.
+        """
+        headers = {"User-Agent": USER_AGENT, **headers}
+        attempt = 0
+        redirects = 0
+        # Set after a pooled connection was found closed, so the retry opens a new one
+        fresh = False
+
+        while True:
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            if self.limiter is not None:
+                self.limiter.acquire()
+            conn, reused = self._acquire(url, fresh)
+            fresh = False
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as ex:
+                conn.close()
+                if reused and isinstance(ex, STALE_CONNECTION_ERRORS):
+                    # Closed by the server while idle, which says nothing about its load
+                    self._release_slot()
+                    logging.debug(
+                        f"Reconnecting for {url} after stale connection: {ex}"
+                    )
+                    fresh = True
+                    continue
+                self._release_slot(0, time.perf_counter() - start)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logging.debug(f"Retrying {url} in {delay:.1f}s after error: {ex}")
+                attempt += 1
+                if self._wait_cancelled(delay):
+                    raise
+                continue
+
+            if self.limiter is not None:
+                self.limiter.observe(response.status, time.perf_counter() - start)
+            if response.status in REDIRECT_STATUSES and redirects < MAX_REDIRECTS:
+                location = response.getheader("Location")
+                response.read()
+                self._release(url, conn, response)
+                self._release_slot()
+                if location:
+                    url = urljoin(url, location.replace(" ", "%20"))
+                    redirects += 1
+                    continue
+                raise HttpError(response.status, url)
+
+            if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                response.read()
+                self._release(url, conn, response)
+                self._release_slot()
+                logging.debug(
+                    f"Retrying {url} in {delay:.1f}s after HTTP {response.status}"
+                )
+                attempt += 1
+                if self._wait_cancelled(delay):
+                    raise HttpError(response.status, url)
+                continue
+
+            return url, conn, response
+
+    def _wait_cancelled(self, delay: float) -> bool:
+        """Sleeps before a retry, returning True early if the operation is cancelled."""
+        cancel_event = self.cancel_event
+        if cancel_event is None:
+            time.sleep(delay)
+            return False
+        return cancel_event.wait(delay)
+
+    def _release_slot(self, status: int | None = None, seconds: float = 0.0):
+        """Frees a limiter slot, reporting a failed request first if status is given."""
+        if self.limiter is None:
+            return
+        if status is not None:
+            self.limiter.observe(status, seconds)
+        self.limiter.release()
+
+    def _acquire(
+        self, url: str, fresh: bool = False
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Returns a connection for url and whether it was reused from the pool."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        if not fresh:
+            with self.lock:
+                idle = self.idle.get(key)
+                if idle:
+                    return idle.pop(), True
+
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(parts.netloc, timeout=self.timeout)
+        return conn, False
+
+    def _release(
+        self,
+        url: str,
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ):
+        """Returns a connection to the pool, or closes it if it can't be reused."""
+        if response.will_close:
+            conn.close()
+            return
+        parts = urlsplit(url)
+        with self.lock:
+            idle = self.idle.setdefault((parts.scheme, parts.netloc), [])
+            if len(idle) < self.pool_size:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Closes every idle connection."""
+        with self.lock:
+            idle, self.idle = self.idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+
+    @staticmethod
+    def _retry_after(response: http.client.HTTPResponse) -> float | None:
+        """Returns the delay asked for by a Retry-After header, if any."""
+        retry_after = response.getheader("Retry-After")
+        if not retry_after:
+            return None
+        if retry_after.strip().isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return min(max(0.0, retry_at.timestamp() - time.time()), BACKOFF_MAX)
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,135 @@
+from .dependencies import get_dependencies
+
+from pathlib import Path
+
+
+class Mod:
+    """An installed mod, keeping only the modinfo.json fields the updater uses."""
+
+    __slots__ = ("mod_id", "name", "version", "path", "dependencies")
+
+    def __init__(
+        self,
+        mod_id: str,
+        name: str,
+        version: str | None,
+        path: Path,
+        dependencies: dict[str, str],
+    ):
+        self.mod_id = mod_id
+        self.name = name
+        self.version = version
+        self.path = path
+        # Keys are lower-cased mod ids, values are minimum versions
+        self.dependencies = dependencies
+
+    @classmethod
+    def from_mod_info(cls, mod_info: dict) -> "Mod":
+        """Creates a mod from a parsed modinfo.json that has a "modid" and "path"."""
+        return cls(
+            mod_info["modid"],
+            mod_info.get("name") or mod_info["modid"],
+            mod_info.get("version"),
+            mod_info["path"],
+            get_dependencies(mod_info),
+        )
+
+
+class Release:
+    """A Mod DB release, keeping only the fields the updater uses."""
+
+    __slots__ = (
+        "version",
+        "tags",
+        "changelog",
+        "filename",
+        "mainfile",
+        "fileid",
+        "filesize",
+        "sha256",
+    )
+
+    def __init__(
+        self,
+        version: str,
+        tags: tuple[str, ...],
+        changelog: str | None,
+        filename: str,
+        mainfile: str,
+        fileid: int | None = None,
+        filesize: int | None = None,
+        sha256: str | None = None,
+    ):
+        self.version = version
+        self.tags = tags
+        self.changelog = changelog
+        self.filename = filename
+        self.mainfile = mainfile
+        self.fileid = fileid
+        self.filesize = filesize
+        self.sha256 = sha256
+
+    @classmethod
+    def from_api(cls, release: dict) -> "Release":
+        """Creates a release from one entry of a "/mod/{id}" response's releases."""
+        return cls(
+            release["modversion"],
+            tuple(release["tags"]),
+            release.get("changelog"),
+            release["filename"],
+            release["mainfile"],
+            release.get("fileid"),
+            release.get("filesize"),
+            release.get("sha256"),
+        )
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Release":
+        return cls(**{**data, "tags": tuple(data["tags"])})
+
+
+class Update:
+    """The newest release of an installed mod and the changelog leading up to it."""
+
+    __slots__ = ("mod_id", "name", "current_version", "latest_release", "changelog")
+
+    def __init__(
+        self,
+        mod_id: str,
+        name: str,
+        current_version: str,
+        latest_release: Release,
+        changelog: tuple[tuple[str, str | None], ...],
+    ):
+        self.mod_id = mod_id
+        self.name = name
+        self.current_version = current_version
+        self.latest_release = latest_release
+        # (version, changelog html) of every newer release that supports the VS version
+        self.changelog = changelog
+
+    @property
+    def latest_version(self) -> str:
+        return self.latest_release.version
+
+    def to_dict(self) -> dict:
+        return {
+            "mod_id": self.mod_id,
+            "name": self.name,
+            "current_version": self.current_version,
+            "latest_release": self.latest_release.to_dict(),
+            "changelog": [list(entry) for entry in self.changelog],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Update":
+        return cls(
+            data["mod_id"],
+            data["name"],
+            data["current_version"],
+            Release.from_dict(data["latest_release"]),
+            tuple(tuple(entry) for entry in data["changelog"]),
+        )
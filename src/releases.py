@@ -0,0 +1,109 @@
+from .utils import parse_version
+from .records import Release
+
+
+class ReleaseIndex:
+    """The releases of one ModDB mod response, parsed once.
+
+    Holds each release's parsed version and tag set so that update selection and the
+    changelog come out of a single pass over the releases, whichever VS version is asked
+    for. Releases are kept as Release records, so the raw response can be freed.
+
+    With min_version, releases older than it are dropped while parsing; they can't be
+    an update or part of its changelog.
+    """
+
+    def __init__(self, mod_db_info: dict, min_version: tuple | None = None):
+        mod = mod_db_info["mod"]
+        self.name = mod["name"]
+        self.releases = []
+        self.version_keys = []
+        # Assuming releases list is always descending from latest
+        for release in mod["releases"]:
+            version_key = parse_version(release["modversion"])
+            if min_version is not None and version_key < min_version:
+                break
+            self.releases.append(Release.from_api(release))
+            self.version_keys.append(version_key)
+        self.tag_sets = [frozenset(r.tags) for r in self.releases]
+        # Newest VS version each release supports
+        self.latest_tag_keys = [
+            parse_version(r.tags[-1]) if r.tags else () for r in self.releases
+        ]
+
+    def supports(self, i: int, vs_version: str, vs_version_key: tuple) -> bool:
+        """Returns whether release i supports a VS version, the way find_update decides.
+
+        That is when the VS version is in its tags, or its minor version matches the
+        minor version of the newest VS version in its tags.
+        """
+        return vs_version in self.tag_sets[i] or (
+            len(vs_version_key) >= 2
+            and len(self.latest_tag_keys[i]) >= 2
+            and vs_version_key[1] == self.latest_tag_keys[i][1]
+        )
+
+    def compatibility(
+        self, current_mod_version: tuple, vs_versions: list[str]
+    ) -> dict[str, tuple[Release | None, bool]]:
+        """Returns the newest release for each of several VS versions, in one pass.
+
+        Values are (newest supporting release or None, whether the installed release
+        supports the VS version). Unlike find_update, older releases than the installed
+        one count too, since a game upgrade can need a downgrade.
+        """
+        targets = {v: parse_version(v) for v in vs_versions}
+        newest = dict.fromkeys(vs_versions)
+        installed = dict.fromkeys(vs_versions, False)
+
+        for i, release_version in enumerate(self.version_keys):
+            is_installed = release_version == current_mod_version
+            for vs_version, vs_version_key in targets.items():
+                if newest[vs_version] is None or is_installed:
+                    supported = self.supports(i, vs_version, vs_version_key)
+                    if supported and newest[vs_version] is None:
+                        newest[vs_version] = self.releases[i]
+                    if is_installed:
+                        installed[vs_version] = supported
+            # Older releases can't change anything once every column is filled
+            if release_version <= current_mod_version and all(newest.values()):
+                break
+
+        return {v: (newest[v], installed[v]) for v in vs_versions}
+
+    def find_update(
+        self, current_mod_version: tuple, vs_version: str
+    ) -> tuple[Release, tuple[tuple[str, str | None], ...]] | None:
+        """Returns the newest release to update to for a VS version and its changelog.
+
+        An update is found if the release version is greater than the current mod
+        version and the VS version is supported by the release, or if the VS version's
+        minor version matches the latest supported VS version's minor version.
+
+        The changelog holds (version, changelog text) for every release newer than the
+        current version that supports the VS version. Returns None if there is no
+        update.
+        """
+        vs_version_key = parse_version(vs_version)
+        latest_release = None
+        changelog = []
+
+        for i, release_version in enumerate(self.version_keys):
+            if release_version > current_mod_version:
+                supported = vs_version in self.tag_sets[i]
+                if supported:
+                    release = self.releases[i]
+                    changelog.append((release.version, release.changelog))
+                if latest_release is None and (
+                    supported or self.supports(i, vs_version, vs_version_key)
+                ):
+                    latest_release = self.releases[i]
+            # Reached the installed version or older before finding an update
+            elif latest_release is None:
+                return None
+            elif release_version == current_mod_version:
+                break
+
+        if latest_release is None:
+            return None
+        return latest_release, tuple(changelog)
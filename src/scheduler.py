@@ -0,0 +1,125 @@
+import time
+import threading
+
+from typing import Callable
+
+# Limits on requests in flight to Mod DB, shared by checks and downloads
+DEFAULT_MIN_CONCURRENCY = 2
+DEFAULT_MAX_CONCURRENCY = 16
+# A response this many times slower than the usual latency counts as congestion...
+LATENCY_TOLERANCE = 4.0
+# ...as long as it is also this many seconds slower, so fast local links don't flap
+LATENCY_SLACK = 0.05
+# Multiplier applied to the limit on congestion
+DECREASE_FACTOR = 0.5
+
+
+class AdaptiveLimiter:
+    """Bounds the number of requests in flight with an AIMD rule.
+
+    Every successful response raises the limit by 1/limit, so by about one request per
+    round of requests. A 429, a 5xx, a connection error or a response much slower than
+    usual halves it, at most once per round: responses to requests sent before the last
+    decrease don't decrease it again. The limit stays between floor and ceiling.
+    """
+
+    def __init__(self, floor: int, ceiling: int, initial: int | None = None):
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.limit = float(
+            min(self.ceiling, max(self.floor, initial or self.ceiling // 2))
+        )
+        self.in_flight = 0
+        # Running estimate of an uncongested response time, in seconds
+        self.baseline = None
+        self.last_decrease = 0.0
+        self.decreases = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Blocks until a request may be sent."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def observe(self, status: int, seconds: float):
+        """Adjusts the limit from the status and latency of a response.
+
+        status is 0 for requests that failed without a response.
+        """
+        now = time.monotonic()
+        with self.condition:
+            failed = status == 0 or status == 429 or status >= 500
+            congested = failed or (
+                self.baseline is not None
+                and seconds
+                > max(self.baseline * LATENCY_TOLERANCE, self.baseline + LATENCY_SLACK)
+            )
+            if not failed:
+                # Follows improvements at once and slowdowns gradually, so a server that
+                # stays slower is eventually treated as normal again
+                if self.baseline is None or seconds < self.baseline:
+                    self.baseline = seconds
+                else:
+                    self.baseline += (seconds - self.baseline) * 0.05
+
+            if congested:
+                if now - seconds >= self.last_decrease:
+                    self.limit = max(self.floor, self.limit * DECREASE_FACTOR)
+                    self.last_decrease = now
+                    self.decreases += 1
+            else:
+                self.limit = min(self.ceiling, self.limit + 1 / self.limit)
+                self.condition.notify_all()
+
+
+class ResultCollector:
+    """Thread-safe collection of per-item results from worker threads.
+
+    on_progress is called with (items done, total items) after every result, under the
+    collector's lock so progress never goes backwards. The total is raised to the number
+    done if it isn't known yet.
+    """
+
+    def __init__(
+        self,
+        on_progress: Callable[[int, int], None] | None = None,
+        total: int = 0,
+    ):
+        self.on_progress = on_progress
+        self.total = total
+        self.lock = threading.Lock()
+        self.results = {}
+        # Items that are done without a result, e.g. unreadable mod zips
+        self.skipped = 0
+
+    def add(self, key: str, result):
+        with self.lock:
+            self.results[key] = result
+            self._report()
+
+    def skip(self, count: int = 1):
+        with self.lock:
+            self.skipped += count
+            self._report()
+
+    def set_total(self, total: int):
+        with self.lock:
+            self.total = total
+            self._report()
+
+    def snapshot(self) -> dict:
+        """Returns a copy of the results collected so far."""
+        with self.lock:
+            return dict(self.results)
+
+    def _report(self):
+        if self.on_progress is not None:
+            done = len(self.results) + self.skipped
+            self.on_progress(done, max(self.total, done))
@@ -0,0 +1,104 @@
+from .records import Update
+
+import re
+import html
+import bisect
+
+from typing import Iterable
+
+# Letters and digits, with dotted runs such as version numbers kept together
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:\.[^\W_]+)*")
+TAG_PATTERN = re.compile(r"<[^>]*>")
+
+
+def plain_text(html_text: str) -> str:
+    """Returns the text of an HTML changelog without tags or entities."""
+    return html.unescape(TAG_PATTERN.sub(" ", html_text))
+
+
+def tokenize(text: str) -> set[str]:
+    # Tokens never span whitespace, so repeated words only need matching once
+    words = set(text.lower().split())
+    return set(TOKEN_PATTERN.findall(" ".join(words)))
+
+
+def update_texts(update: Update) -> Iterable[str]:
+    """Yields the searchable text of an update: its name, mod id and changelogs."""
+    yield update.name
+    yield update.mod_id
+    for version, changelog in update.changelog:
+        yield version
+        if changelog:
+            yield plain_text(changelog)
+
+
+class SearchIndex:
+    """Inverted index from tokens to keys, for prefix searches as the user types.
+
+    A query matches the keys that have, for every token of the query, a token starting
+    with it, so "carry fix" finds a mod named Carry On whose changelog says "fixed".
+    Results of the last query are kept until the index changes.
+    """
+
+    def __init__(self):
+        # Keys are tokens, values are the keys they occur in
+        self.postings = {}
+        # Keys are keys, values are their tokens, for removal
+        self.key_tokens = {}
+        # Distinct tokens in order, rebuilt on the first search after a change
+        self.sorted_tokens = None
+        self.last_query = None
+        self.last_matches = None
+
+    def add(self, key: str, texts: Iterable[str]):
+        self.remove(key)
+        tokens = tokenize("\n".join(texts))
+        self.key_tokens[key] = tokens
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(key)
+        self.changed()
+
+    def remove(self, key: str):
+        for token in self.key_tokens.pop(key, ()):
+            keys = self.postings[token]
+            keys.discard(key)
+            if not keys:
+                del self.postings[token]
+        self.changed()
+
+    def clear(self):
+        self.postings.clear()
+        self.key_tokens.clear()
+        self.changed()
+
+    def changed(self):
+        self.sorted_tokens = None
+        self.last_query = None
+
+    def search(self, query: str) -> set[str] | None:
+        """Returns the keys matching a query, or None for an empty query."""
+        query_tokens = sorted(tokenize(query), key=len, reverse=True)
+        if not query_tokens:
+            return None
+        if query_tokens == self.last_query:
+            return self.last_matches
+        if self.sorted_tokens is None:
+            self.sorted_tokens = sorted(self.postings)
+
+        matches = None
+        # Longest tokens first, as they usually narrow the matches down the most
+        for query_token in query_tokens:
+            keys = set()
+            i = bisect.bisect_left(self.sorted_tokens, query_token)
+            while i < len(self.sorted_tokens) and self.sorted_tokens[i].startswith(
+                query_token
+            ):
+                keys |= self.postings[self.sorted_tokens[i]]
+                i += 1
+            matches = keys if matches is None else matches & keys
+            if not matches:
+                break
+
+        self.last_query = query_tokens
+        self.last_matches = matches
+        return matches
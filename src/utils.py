@@ -1,6 +1,11 @@
 import re
+import functools
 
+from datetime import datetime
 
+
+# Memoized; the same mod and game versions are parsed over and over during a check
+@functools.lru_cache(maxsize=8192)
 def parse_version(version: str) -> tuple[int]:
     """Takes a version string and parses it into a tuple; useful for comparisons
 
@@ -42,3 +47,13 @@ def fix_json_string(json_string: str) -> str:
     # Remove trailing commas before } or ]
     json_str = re.sub(r",(\s*[}\]])", r"\1", json_string)
     return json_str
+
+
+def parse_timestamp(timestamp: str | None) -> datetime | None:
+    """Parses a ModDB timestamp such as '2024-11-05 12:34:56', or returns None."""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
@@ -1,32 +1,130 @@
 from .utils import *
-
-import zipfile
-import json
-import urllib.request
+from .core import DEFAULT_CACHE_SIZE_MB, DEFAULT_CACHE_TTL_MINUTES, UpdaterCore
+from .scheduler import DEFAULT_MAX_CONCURRENCY, DEFAULT_MIN_CONCURRENCY
+from .archive_cache import DEFAULT_ARCHIVE_CACHE_SIZE_MB
+from .mod_index import ModsFolderIndex
+from .records import Update
+from .models import UpdatesFilterModel, UpdatesModel
+
+import os
+import sys
+import bisect
+import ctypes
 import logging
-import concurrent.futures
+import threading
 import mobase  # type: ignore
 import PyQt6.QtGui as QtGui  # type: ignore
 import PyQt6.QtWidgets as QtWidgets  # type: ignore
 
-from PyQt6.QtCore import Qt, QSize  # type: ignore
+from PyQt6.QtCore import (  # type: ignore
+    Qt,
+    QFileSystemWatcher,
+    QObject,
+    QSize,
+    QThread,
+    QTimer,
+    pyqtSignal,
+)
 from typing import List
+from collections import OrderedDict
 from pathlib import Path
+from datetime import datetime
+
+PLUGIN_NAME = "VS Mod Updater"
+# Most requests in flight for background checks, to stay out of the way of MO2 and games
+BACKGROUND_MAX_CONNECTIONS = 4
+DEFAULT_BACKGROUND_INTERVAL_MINUTES = 60
+# THREAD_PRIORITY_LOWEST on Windows, and the highest nice value elsewhere
+WINDOWS_LOWEST_PRIORITY = -2
+POSIX_LOWEST_PRIORITY = 19
+
+
+def lower_thread_priority():
+    """Lowers the priority of the calling thread, for the pools of background checks.
+
+    QThread priorities only apply to the QThread itself; the worker pools that the core
+    starts from it would otherwise run at normal priority.
+    """
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(), WINDOWS_LOWEST_PRIORITY
+            )
+        else:
+            # Linux applies nice values per thread
+            os.setpriority(
+                os.PRIO_PROCESS, threading.get_native_id(), POSIX_LOWEST_PRIORITY
+            )
+    except Exception as ex:
+        logging.debug(f"Could not lower the priority of a background thread: {ex}")
+
+
+def create_core(
+    organizer: mobase.IOrganizer,
+    mods_index: ModsFolderIndex | None = None,
+    max_connections: int | None = None,
+) -> UpdaterCore:
+    """Creates an UpdaterCore for MO2's mods folder and game from the plugin settings.
+
+    max_connections further limits the max_connections setting.
+    """
+
+    def setting(key: str):
+        return organizer.pluginSetting(PLUGIN_NAME, key)
+
+    max_concurrency = setting("max_connections")
+    if max_connections is not None:
+        max_concurrency = min(max_concurrency, max_connections)
+    return UpdaterCore(
+        Path(organizer.modsPath()),
+        normalize_version(organizer.managedGame().gameVersion()),
+        Path(organizer.pluginDataPath()) / "vs_mod_updater",
+        setting("api_cache_ttl"),
+        setting("api_cache_size"),
+        min_concurrency=min(setting("min_connections"), max_concurrency),
+        max_concurrency=max_concurrency,
+        archive_cache_size_mb=setting("archive_cache_size"),
+        mods_index=mods_index,
+    )
 
 
 class PluginWindow(QtWidgets.QDialog):
-    def __init__(self, organizer: mobase.IOrganizer, parent=None):
+    # Emitted once the workers still running when the window was closed have stopped
+    stopped = pyqtSignal()
+
+    def __init__(
+        self,
+        organizer: mobase.IOrganizer,
+        mods_index: ModsFolderIndex | None = None,
+        background: "BackgroundChecker | None" = None,
+        parent=None,
+    ):
         self.organizer = organizer
-        self.current_vs_version = normalize_version(
-            self.organizer.managedGame().gameVersion()
-        )
-        # Base vintage story Mod DB API url
-        self.base_url = "https://mods.vintagestory.at/api"
-        # Keys are mod ids, value is an object of each mods' JSON
-        self.mods_data = {}
+        self.mods_index = mods_index
+        # Scanning, checking and updating, shared with the command line
+        self.core = create_core(organizer, mods_index)
+        # Set while a cancelled background check still writes to the same caches
+        self.background = None
+        # Sorted by name as updates stream in from the check worker
         self.mod_updates = []
-        self.model = QtGui.QStandardItemModel()
+        self.check_worker = None
+        self.plan_worker = None
+        self.download_worker = None
+        self.compatibility_worker = None
+        # Workers cancelled by closing the window that haven't stopped yet
+        self.stopping_workers = 0
+        # Set once a mod was updated, so MO2 knows to refresh
+        self.mods_changed = False
+        # Keys are mod ids of running downloads, values are their progress from 0 to 1
+        self.download_progress = {}
+        self.model = UpdatesModel()
+        # What the tree shows: the updates matching the filter box
+        self.filter_model = UpdatesFilterModel()
+        self.filter_model.setSourceModel(self.model)
         self.tree = QtWidgets.QTreeView()
+        # Timings of the last check and download, only shown when enabled in settings
+        self.diagnostics_panel = None
 
         super(PluginWindow, self).__init__(parent)
 
@@ -38,25 +136,85 @@ class PluginWindow(QtWidgets.QDialog):
 
         # Left layout
         left_vertical_layout = QtWidgets.QVBoxLayout()
-        check_updates_btn = QtWidgets.QPushButton("🔄 Check for Updates", self)
-        check_updates_btn.clicked.connect(self.check_for_updates)
-        left_vertical_layout.addWidget(check_updates_btn)
+        self.check_updates_btn = QtWidgets.QPushButton("🔄 Check for Updates", self)
+        self.check_updates_btn.clicked.connect(self.check_for_updates)
+        left_vertical_layout.addWidget(self.check_updates_btn)
+        self.force_refresh_checkbox = QtWidgets.QCheckBox("Force refresh", self)
+        self.force_refresh_checkbox.setToolTip(
+            "Ignore cached Mod DB data and download everything again"
+        )
+        left_vertical_layout.addWidget(self.force_refresh_checkbox)
+
+        # Middle layout
+        middle_vertical_layout = QtWidgets.QVBoxLayout()
+        self.compatibility_btn = QtWidgets.QPushButton("🔮 Compatibility", self)
+        self.compatibility_btn.setToolTip(
+            "Show the newest release of every mod for other game versions, "
+            "e.g. before upgrading Vintage Story"
+        )
+        self.compatibility_btn.clicked.connect(self.check_compatibility)
+        middle_vertical_layout.addWidget(self.compatibility_btn)
+        middle_vertical_layout.addStretch()
 
         # Right layout
         right_vertical_layout = QtWidgets.QVBoxLayout()
-        update_mods_btn = QtWidgets.QPushButton("Update Mods ⬇️", self)
-        update_mods_btn.clicked.connect(self.update_mods)
-        right_vertical_layout.addWidget(update_mods_btn)
+        self.update_mods_btn = QtWidgets.QPushButton("Update Mods ⬇️", self)
+        self.update_mods_btn.clicked.connect(self.update_mods)
+        right_vertical_layout.addWidget(self.update_mods_btn)
+        self.last_checked_label = QtWidgets.QLabel("", self)
+        right_vertical_layout.addWidget(self.last_checked_label)
 
         # Buttons layout
         buttons_layout = QtWidgets.QHBoxLayout()
         buttons_layout.addLayout(left_vertical_layout)
+        buttons_layout.addLayout(middle_vertical_layout)
         buttons_layout.addLayout(right_vertical_layout)
 
+        # Progress layout, only shown while checking for updates
+        progress_layout = QtWidgets.QHBoxLayout()
+        self.progress_label = QtWidgets.QLabel("", self)
+        self.cancel_btn = QtWidgets.QPushButton("Cancel", self)
+        self.cancel_btn.clicked.connect(self.cancel_running)
+        self.progress_bar = QtWidgets.QProgressBar(self)
+        progress_layout.addWidget(self.progress_label, 1)
+        progress_layout.addWidget(self.progress_bar, 1)
+        progress_layout.addWidget(self.cancel_btn)
+        self.progress_label.hide()
+        self.progress_bar.hide()
+        self.cancel_btn.hide()
+
+        # Filter layout
+        filter_layout = QtWidgets.QHBoxLayout()
+        self.filter_edit = QtWidgets.QLineEdit(self)
+        self.filter_edit.setPlaceholderText("Filter by name, mod id or changelog...")
+        self.filter_edit.setClearButtonEnabled(True)
+        # Filters once typing pauses rather than on every key
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+        self.check_shown_btn = QtWidgets.QPushButton("Check shown", self)
+        self.check_shown_btn.clicked.connect(lambda: self.check_shown(True))
+        self.uncheck_shown_btn = QtWidgets.QPushButton("Uncheck shown", self)
+        self.uncheck_shown_btn.clicked.connect(lambda: self.check_shown(False))
+        self.filter_label = QtWidgets.QLabel("", self)
+        filter_layout.addWidget(self.filter_edit, 1)
+        filter_layout.addWidget(self.filter_label)
+        filter_layout.addWidget(self.check_shown_btn)
+        filter_layout.addWidget(self.uncheck_shown_btn)
+        for signal in (
+            self.filter_model.rowsInserted,
+            self.filter_model.rowsRemoved,
+            self.filter_model.modelReset,
+        ):
+            signal.connect(self.show_filter_count)
+
         # Main Layout
         main_layout = QtWidgets.QVBoxLayout()
         main_layout.addLayout(buttons_layout)
-        self.model.setHorizontalHeaderLabels(["Name", "Version"])
+        main_layout.addLayout(progress_layout)
+        main_layout.addLayout(filter_layout)
         self.tree.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
 
         # Enable rich text rendering in the tree view (only applies to child items)
@@ -65,9 +223,139 @@ class PluginWindow(QtWidgets.QDialog):
         self.tree.setWordWrap(True)
 
         main_layout.addWidget(self.tree)
-        self.tree.setModel(self.model)
+        self.tree.setModel(self.filter_model)
+        if self.plugin_setting("diagnostics"):
+            self.diagnostics_panel = QtWidgets.QPlainTextEdit(self)
+            self.diagnostics_panel.setReadOnly(True)
+            self.diagnostics_panel.setMaximumHeight(120)
+            main_layout.addWidget(self.diagnostics_panel)
         self.setLayout(main_layout)
         self.tree.setColumnWidth(0, 500)
+        self.show_last_updates()
+        if background is not None and background.is_running():
+            self.background = background
+            background.stopped.connect(self.on_background_stopped)
+            self.set_busy(True, "Waiting for the background check to stop...")
+            self.cancel_btn.hide()
+
+    def on_background_stopped(self):
+        """Reloads the caches the background check wrote and unlocks the window."""
+        self.background.stopped.disconnect(self.on_background_stopped)
+        self.background = None
+        self.core.close()
+        self.core = create_core(self.organizer, self.mods_index)
+        self.mod_updates.clear()
+        self.model.clear()
+        self.show_last_updates()
+        self.set_busy(False)
+
+    def apply_filter(self):
+        with self.core.diagnostics.phase("filter"):
+            self.filter_model.set_query(self.filter_edit.text())
+        self.show_filter_count()
+
+    def show_filter_count(self):
+        """Shows how many updates match the filter, if one is set."""
+        if self.filter_model.query.strip():
+            self.filter_label.setText(
+                f"{self.filter_model.rowCount()} of {self.model.rowCount()} shown"
+            )
+        else:
+            self.filter_label.setText("")
+
+    def check_shown(self, checked: bool):
+        """Checks or unchecks every update the filter shows."""
+        self.model.set_checked(self.filter_model.visible_mod_ids(), checked)
+
+    def show_last_updates(self):
+        """Fills the tree with the updates of the last check, without a new check."""
+        for update in self.core.last_updates():
+            self.on_update_found(update)
+        self.show_last_checked()
+
+    def show_last_checked(self):
+        last_checked = self.core.check_results.last_checked
+        if last_checked is None:
+            self.last_checked_label.setText("Not checked yet")
+        else:
+            checked_at = datetime.fromtimestamp(last_checked).strftime("%Y-%m-%d %H:%M")
+            self.last_checked_label.setText(f"Last checked {checked_at}")
+
+    def plugin_setting(self, key: str):
+        """Returns the value of one of VSModUpdaterPlugin's settings."""
+        return self.organizer.pluginSetting(PLUGIN_NAME, key)
+
+    def done(self, result: int):
+        # Don't leave workers running behind a closed dialog, but don't block the GUI
+        # thread on them either; the core is closed once the last one has stopped
+        if self.background is not None:
+            self.background.stopped.disconnect(self.on_background_stopped)
+            self.background = None
+        workers = self.workers()
+        self.stopping_workers = len(workers)
+        for worker in workers:
+            worker.cancel()
+            # Results of a cancelled run are no longer shown anywhere
+            worker.finished.disconnect()
+            worker.finished.connect(self.on_worker_stopped)
+        if not workers:
+            self.core.close()
+        super().done(result)
+
+    def on_worker_stopped(self):
+        self.stopping_workers -= 1
+        if self.stopping_workers == 0:
+            self.core.close()
+            self.stopped.emit()
+
+    def wait_for_workers(self):
+        """Blocks until the workers of the closed window have stopped; for shutdown."""
+        for worker in self.workers():
+            worker.wait()
+        if self.stopping_workers > 0:
+            self.stopping_workers = 0
+            self.core.close()
+
+    def workers(self) -> list[QThread]:
+        """Returns the background workers that are running."""
+        return [
+            worker
+            for worker in (
+                self.check_worker,
+                self.plan_worker,
+                self.download_worker,
+                self.compatibility_worker,
+            )
+            if worker is not None
+        ]
+
+    def set_busy(self, busy: bool, text: str = ""):
+        """Shows or hides the progress row and locks the buttons while a worker runs."""
+        self.check_updates_btn.setEnabled(not busy)
+        self.update_mods_btn.setEnabled(not busy)
+        self.compatibility_btn.setEnabled(not busy)
+        self.progress_label.setText(text)
+        self.progress_label.setVisible(busy)
+        self.cancel_btn.setEnabled(busy)
+        self.cancel_btn.setVisible(busy)
+        if not busy:
+            self.progress_bar.hide()
+
+    def show_diagnostics(self):
+        """Writes the diagnostics report of the last run and shows its summary."""
+        if self.diagnostics_panel is None:
+            return
+        diagnostics = self.core.diagnostics
+        report = diagnostics.report()
+        diagnostics.write(self.core.data_path / "diagnostics.json", report)
+        self.diagnostics_panel.setPlainText(diagnostics.summarize(report))
+
+    def cancel_running(self):
+        """Stops the running check or download; finished work is kept."""
+        for worker in self.workers():
+            self.cancel_btn.setEnabled(False)
+            self.progress_label.setText("Cancelling...")
+            worker.cancel()
 
     def update_mods(self):
         """Downloads all updates for mods in MO2 that are checked."""
@@ -79,26 +367,55 @@ class PluginWindow(QtWidgets.QDialog):
             return
 
         # Count how many mods are selected for update
-        selected_count = 0
-        for row in range(self.model.rowCount()):
-            update_item = self.model.item(row, 0)
-            if (
-                update_item is not None
-                and update_item.checkState() == Qt.CheckState.Checked
-            ):
-                selected_count += 1
-
-        if selected_count == 0:
+        selected_mod_ids = set(self.model.checked_mod_ids())
+
+        if not selected_mod_ids:
             QtWidgets.QMessageBox.information(
                 self, "No Selection", "No mods are selected for update."
             )
             return
 
+        # Find the corresponding updates by mod_id, plus the updates they need; results
+        # from the last session may need a scan of the mods folder first
+        self.set_busy(True, "Scanning mods...")
+        self.plan_worker = UpdatePlanWorker(
+            self.core,
+            [u for u in self.mod_updates if u.mod_id in selected_mod_ids],
+            self.mod_updates,
+            self,
+        )
+        self.plan_worker.finished.connect(self.on_plan_finished)
+        self.plan_worker.start()
+
+    def on_plan_finished(self):
+        """Asks to confirm the planned updates, then downloads them."""
+        worker = self.plan_worker
+        self.plan_worker = None
+        self.set_busy(False)
+
+        if worker.is_cancelled():
+            return
+        if worker.error is not None:
+            QtWidgets.QMessageBox.critical(
+                self, "Error", f"Could not plan the updates:\n\n{worker.error}"
+            )
+            return
+        plan = worker.plan
+        selected_updates = plan.updates
+        dependency_note = ""
+        if plan.pulled_in:
+            pulled_in_list = "\n".join(f"• {u.name}" for u in plan.pulled_in)
+            dependency_note = (
+                f"These mod(s) are needed by the selected ones and will be updated "
+                f"too:\n{pulled_in_list}\n\n"
+            )
+
         # Show confirmation dialog
         reply = QtWidgets.QMessageBox.question(
             self,
             "Confirm Updates",
-            f"Are you sure you want to update {selected_count} mod(s)?\n\n"
+            f"Are you sure you want to update {len(selected_updates)} mod(s)?\n\n"
+            f"{dependency_note}"
             "This will download new versions and replace the existing mod files.",
             QtWidgets.QMessageBox.StandardButton.Yes
             | QtWidgets.QMessageBox.StandardButton.No,
@@ -108,53 +425,72 @@ class PluginWindow(QtWidgets.QDialog):
         if reply != QtWidgets.QMessageBox.StandardButton.Yes:
             return
 
-        # Track successful updates
-        successful_updates = 0
-        failed_updates = []
-
-        # Iterate backwards to avoid skipping rows when removing
-        for row in reversed(range(self.model.rowCount())):
-            update_item = self.model.item(row, 0)
-            if (
-                update_item is not None
-                and update_item.checkState() == Qt.CheckState.Checked
-            ):
-                mod_id = update_item.data(Qt.ItemDataRole.UserRole)
-                # Find the corresponding update dict by mod_id
-                update_data = next(
-                    (u for u in self.mod_updates if u["mod_id"] == mod_id), None
-                )
-                if not update_data:
-                    continue
-                latest_release = update_data["latest_release"]
-                filename = latest_release["filename"]
-                download_url = latest_release["mainfile"]
-                mod_name = update_data["name"]
-                download_url = download_url.replace(" ", "%20")
-                
-                try:
-                    old_zip_path = self.mods_data[mod_id]["path"]
-
-                    # Download the mod zip file
-                    response = urllib.request.urlopen(download_url)
-                    # Output in old_zip_path.parent
-                    logging.debug(f"Downloading {filename} from {download_url}")
-                    zip_path = old_zip_path.parent / filename
-                    with open(zip_path, "wb") as out_file:
-                        out_file.write(response.read())
-                    logging.info(f"Downloaded {filename} to {zip_path}")
-                    # Remove update_item from model
-                    self.model.removeRow(row)
-                    # Delete old mod zip file if it exists
-                    logging.debug(f"Deleting old mod zip: {old_zip_path}")
-                    old_zip_path.unlink()
-                    successful_updates += 1
-                except Exception as ex:
-                    logging.critical(f"Error downloading {filename}: {ex}")
-                    failed_updates.append(mod_name)
+        self.successful_updates = 0
+        self.failed_updates = []
+        self.download_progress = {u.mod_id: 0.0 for u in selected_updates}
+        self.set_busy(True, f"Updating 0/{len(selected_updates)} mods")
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+        self.download_worker = UpdateDownloadWorker(
+            self.core, selected_updates, self.mod_updates, self
+        )
+        self.download_worker.mod_progress.connect(self.on_download_progress)
+        self.download_worker.mod_finished.connect(self.on_download_finished)
+        self.download_worker.finished.connect(self.on_downloads_finished)
+        self.download_worker.start()
+
+    def on_download_progress(self, mod_id: str, done: int, total: int):
+        if total:
+            self.download_progress[mod_id] = done / total
+            self.model.set_status(mod_id, f"Downloading {done * 100 // total}%")
+        else:
+            self.model.set_status(mod_id, f"Downloading {done // 1024} KiB")
+
+        overall = sum(self.download_progress.values()) / len(self.download_progress)
+        self.progress_bar.setValue(int(overall * 1000))
 
+    def on_download_finished(self, mod_id: str, new_path: str, error: str):
+        """Removes an updated mod from the tree, or restores its row if it failed."""
+        update_data = next(u for u in self.mod_updates if u.mod_id == mod_id)
+        self.download_progress[mod_id] = 1.0
+
+        if error:
+            self.failed_updates.append(update_data.name)
+            self.model.set_status(mod_id, None)
+        else:
+            self.successful_updates += 1
+            self.mods_changed = True
+            self.mod_updates.remove(update_data)
+            self.model.remove_update(mod_id)
+
+        finished = self.successful_updates + len(self.failed_updates)
+        self.progress_label.setText(
+            f"Updating {finished}/{len(self.download_progress)} mods"
+        )
+
+    def on_downloads_finished(self):
+        worker = self.download_worker
+        self.download_worker = None
+        self.set_busy(False)
+        self.show_diagnostics()
+        successful_updates = self.successful_updates
+        failed_updates = self.failed_updates
+
+        if worker.error is not None:
+            # Mods the run never got to keep their rows
+            for mod_id, progress in self.download_progress.items():
+                if progress < 1.0:
+                    self.model.set_status(mod_id, None)
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Error",
+                f"Updating stopped after {successful_updates} mod(s):\n\n"
+                f"{worker.error}",
+            )
         # Show completion dialog
-        if successful_updates > 0 or failed_updates:
+        elif successful_updates > 0 or failed_updates:
             if failed_updates:
                 # Some updates failed
                 failed_list = "\n".join(f"• {mod}" for mod in failed_updates)
@@ -174,252 +510,379 @@ class PluginWindow(QtWidgets.QDialog):
                 )
 
     def check_for_updates(self):
-        """Checks for updates for all mods in MO2."""
-        # Show loading overlay until updates are checked
-        loading_label = QtWidgets.QLabel("Checking for updates...", self)
-        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        loading_label.setStyleSheet(
-            "background: rgba(255,255,255,150); font-size: 18px; padding: 40px; border: 2px solid #888;"
-        )
-        loading_label.setGeometry(self.rect())
-        loading_label.show()
-        QtWidgets.QApplication.processEvents()  # Force update
+        """Checks for updates for all mods in MO2 on a background worker.
 
-        self.populate_mods_data()
-        if not self.mods_data:
-            loading_label.hide()
-            QtWidgets.QMessageBox.warning(
-                self,
-                "No Mods Found",
-                "No mods found in MO2. Please add some mods first.",
-            )
+        Updates are added to the tree as soon as they are found.
+        """
+        if self.check_worker is not None:
             return
 
         # Clear previous updates
         self.mod_updates.clear()
+        self.core.force_refresh = self.force_refresh_checkbox.isChecked()
+        self.model.clear()
+        self.tree.setColumnWidth(0, 500)
 
-        def safe_check(mod_id):
-            try:
-                self.check_mod_for_update(mod_id)
-            except Exception as ex:
-                logging.critical(f"Error checking mod {mod_id}: {ex}")
+        self.set_busy(True, "Scanning mods...")
 
-        # Run checks in parallel using ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            list(executor.map(safe_check, self.mods_data.keys()))
+        self.check_worker = UpdateCheckWorker(self.core, self)
+        self.check_worker.progress.connect(self.on_check_progress)
+        self.check_worker.update_found.connect(self.on_update_found)
+        self.check_worker.finished.connect(self.on_check_finished)
+        self.check_worker.start()
 
-        loading_label.hide()
+    def on_check_progress(self, checked: int, total: int):
+        self.progress_label.setText(f"{checked}/{total} mods checked")
 
-        if not self.mod_updates:
+    def on_update_found(self, update: Update):
+        """Inserts an update into the tree, keeping rows sorted by name."""
+        row = bisect.bisect(self.mod_updates, update.name, key=lambda x: x.name)
+        self.mod_updates.insert(row, update)
+        with self.core.diagnostics.phase("model_build"):
+            self.model.insert_update(row, update)
+
+    def on_check_finished(self):
+        worker = self.check_worker
+        self.check_worker = None
+        self.set_busy(False)
+        self.show_diagnostics()
+        self.show_last_checked()
+
+        if worker.error is not None:
+            QtWidgets.QMessageBox.critical(
+                self, "Error", f"Could not check for updates:\n\n{worker.error}"
+            )
+        elif worker.is_cancelled():
+            logging.info(
+                f"Update check cancelled, {len(self.mod_updates)} found so far."
+            )
+        elif self.core.mod_count == 0:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "No Mods Found",
+                "No mods found in MO2. Please add some mods first.",
+            )
+        elif not self.mod_updates:
             QtWidgets.QMessageBox.information(
                 self, "No Updates", "All mods are up to date :)"
             )
         else:
             logging.info(f"Found {len(self.mod_updates)} mod updates.")
 
-        # Sort mod updates by name
-        self.mod_updates.sort(key=lambda x: x["name"])
+        logging.debug(str(self.mod_updates))
 
-        # Clear the model and populate it with mod updates
-        self.model.clear()
-        self.model.setHorizontalHeaderLabels(["Name", "Version"])
-
-        for update in self.mod_updates:
-            # Create item to display the update
-            update_item = QtGui.QStandardItem(update["name"])
-            update_item.setEditable(False)
-            update_item.setCheckable(True)
-            update_item.setCheckState(Qt.CheckState.Checked)
-            update_item.setData(update["mod_id"], Qt.ItemDataRole.UserRole)
-
-            version_item = QtGui.QStandardItem(
-                f"{update['current_version']} → {update['latest_version']}"
+    def check_compatibility(self):
+        """Shows which release of every mod supports other VS versions."""
+        if self.compatibility_worker is not None:
+            return
+
+        text, ok = QtWidgets.QInputDialog.getText(
+            self,
+            "Compatibility",
+            "Game versions to compare, separated by commas.\n"
+            "Leave empty for the installed and the latest version.",
+        )
+        if not ok:
+            return
+        vs_versions = [
+            version.strip() for version in text.split(",") if version.strip()
+        ]
+
+        self.set_busy(True, "Scanning mods...")
+        self.compatibility_worker = CompatibilityWorker(self.core, vs_versions, self)
+        self.compatibility_worker.progress.connect(self.on_compatibility_progress)
+        self.compatibility_worker.finished.connect(self.on_compatibility_finished)
+        self.compatibility_worker.start()
+
+    def on_compatibility_progress(self, evaluated: int, total: int):
+        self.progress_label.setText(f"{evaluated}/{total} mods evaluated")
+
+    def on_compatibility_finished(self):
+        worker = self.compatibility_worker
+        self.compatibility_worker = None
+        self.set_busy(False)
+        self.show_diagnostics()
+
+        if worker.is_cancelled():
+            return
+        if worker.error is not None:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Error",
+                f"Could not compare VS versions:\n\n{worker.error}",
             )
-            version_item.setEditable(False)
-
-            # Add change log for each release since the current version
-            for changes in update["changelog"]:
-                for version, changelog_text in changes.items():
-                    # Create a rich text item for the changelog
-                    changelog_item = QtGui.QStandardItem()
-                    if changelog_text == "":
-                        changelog_item.setText("<i>No changelog found.</i>")
-                    else:
-                        changelog_item.setText(changelog_text)
-
-                    changelog_item.setEditable(False)
-                    changelog_version_item = QtGui.QStandardItem(
-                        f"<div style='text-align:center;'><i>{version}</i></div>"
-                    )
-                    changelog_version_item.setEditable(False)
-                    changelog_version_item.setSelectable(False)
-                    update_item.appendRow([changelog_item, changelog_version_item])
-
-            self.model.appendRow([update_item, version_item])
+            return
+        if worker.matrix is None:
+            return
+        if not worker.matrix["mods"]:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "No Mods Found",
+                "No mods found in MO2. Please add some mods first.",
+            )
+            return
+        CompatibilityDialog(worker.matrix, self).exec()
 
-        self.tree.setColumnWidth(0, 500)
 
-        logging.debug(str(self.mod_updates))
+class CompatibilityDialog(QtWidgets.QDialog):
+    """Table of the newest release of every mod for each compared VS version.
 
-    def check_mod_for_update(self, mod_id: str):
-        mod_db_info = self.get_mod_info_from_api(mod_id)
-        current_mod_version = self.mods_data[mod_id]["version"]
-        current_mod_version_parsed = parse_version(current_mod_version)
-
-        latest_mod_version = None
-        latest_mod_release = None
-        # Getting latest mod release that supports current VS version
-        for release in mod_db_info["mod"]["releases"]:
-            release_version = release["modversion"]
-            release_version_parsed = parse_version(release_version)
-            latest_supported_vs_version = parse_version(release["tags"][-1])
-            current_vs_version_parsed = parse_version(self.current_vs_version)
-            # An update is found if the release version is greater than the current mod version
-            # and the current VS version is supported by the release
-            # or if the current VS version's minor version matches the latest supported VS version's minor version
-            if release_version_parsed > current_mod_version_parsed and (
-                self.current_vs_version in release["tags"]
-                or (
-                    len(current_vs_version_parsed) >= 2
-                    and len(latest_supported_vs_version) >= 2
-                    and current_vs_version_parsed[1] == latest_supported_vs_version[1]
-                )
-            ):
-                latest_mod_version = release["modversion"]
-                latest_mod_release = release
-                break
-            # No update found
-            elif current_mod_version_parsed >= release_version_parsed:
-                return
-
-        # If no update was found
-        # and if 'current_mod_version_parsed >= release_version_parsed' was never reached
-        if latest_mod_version is None or latest_mod_release is None:
-            return
+    Green cells are supported by the installed release, yellow ones need another
+    release and red ones have no release at all.
+    """
 
-        self.mod_updates.append(
-            {
-                "mod_id": mod_id,
-                "name": mod_db_info["mod"]["name"],
-                "current_version": current_mod_version,
-                "latest_version": latest_mod_version,
-                "latest_release": latest_mod_release,
-                "changelog": self.generate_changelog(
-                    mod_db_info, current_mod_version_parsed
-                ),
-            }
-        )
+    SUPPORTED_COLOR = QtGui.QColor(0, 160, 0, 60)
+    UPDATE_COLOR = QtGui.QColor(220, 170, 0, 70)
+    MISSING_COLOR = QtGui.QColor(200, 0, 0, 60)
 
-    def generate_changelog(
-        self, mod_db_info: dict, current_mod_version: tuple
-    ) -> list[dict]:
-        """
-        Generates a changelog between the current and latest release.
+    def __init__(self, matrix: dict, parent=None):
+        super(CompatibilityDialog, self).__init__(parent)
+        self.setWindowTitle("Compatibility")
+        self.resize(800, 600)
 
-        The changelog is a list of dictionaries where keys are version numbers and values are the changelog text.
-        """
-        changelog = []
-        for release in mod_db_info["mod"]["releases"]:
-            release_version = parse_version(release["modversion"])
-            valid_release = (
-                self.current_vs_version in release["tags"]
-                and release_version > current_mod_version
+        vs_versions = matrix["vs_versions"]
+        rows = matrix["mods"]
+        table = QtWidgets.QTableWidget(len(rows), 2 + len(vs_versions), self)
+        table.setHorizontalHeaderLabels(
+            ["Mod", "Installed"] + [f"VS {version}" for version in vs_versions]
+        )
+        table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.verticalHeader().hide()
+        # Filled in before sorting is turned on so rows don't move while filling
+        for row, mod in enumerate(rows):
+            table.setItem(row, 0, QtWidgets.QTableWidgetItem(mod["name"]))
+            table.setItem(
+                row, 1, QtWidgets.QTableWidgetItem(mod["installed_version"] or "")
             )
-            if valid_release:
-                changelog.append({release["modversion"]: release["changelog"]})
-            # Assuming releases list is always descending from latest
-            elif release_version == current_mod_version:
-                break
-        return changelog
-
-    def populate_mods_data(self):
-        """Populates mods_data for each mod in MO2 from their modinfo.json file."""
-        mods_path = Path(self.organizer.modsPath())
+            for column, vs_version in enumerate(vs_versions, start=2):
+                table.setItem(row, column, self.release_item(mod, vs_version))
+        table.setSortingEnabled(True)
+        table.sortItems(0)
+        table.resizeColumnsToContents()
+
+        summary = QtWidgets.QLabel(self.summary(matrix), self)
+        close_btn = QtWidgets.QPushButton("Close", self)
+        close_btn.clicked.connect(self.accept)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(table)
+        layout.addWidget(summary)
+        layout.addWidget(close_btn, alignment=Qt.AlignmentFlag.AlignRight)
+
+    def release_item(self, mod: dict, vs_version: str) -> QtWidgets.QTableWidgetItem:
+        if mod["releases"] is None:
+            item = QtWidgets.QTableWidgetItem("?")
+            item.setToolTip("Mod DB data could not be fetched")
+            return item
+
+        release = mod["releases"][vs_version]
+        if release["installed_supported"]:
+            item = QtWidgets.QTableWidgetItem(mod["installed_version"] or "")
+            item.setToolTip("The installed release supports this version")
+            item.setBackground(self.SUPPORTED_COLOR)
+        elif release["version"] is not None:
+            item = QtWidgets.QTableWidgetItem(release["version"])
+            item.setToolTip(f"Needs {release['filename']}")
+            item.setBackground(self.UPDATE_COLOR)
+        else:
+            item = QtWidgets.QTableWidgetItem("none")
+            item.setToolTip("No release supports this version")
+            item.setBackground(self.MISSING_COLOR)
+        return item
+
+    @staticmethod
+    def summary(matrix: dict) -> str:
+        """Returns one line per VS version counting the mods that would work on it."""
+        lines = []
+        for vs_version in matrix["vs_versions"]:
+            releases = [
+                mod["releases"][vs_version]
+                for mod in matrix["mods"]
+                if mod["releases"] is not None
+            ]
+            supported = sum(1 for r in releases if r["installed_supported"])
+            updatable = sum(
+                1
+                for r in releases
+                if not r["installed_supported"] and r["version"] is not None
+            )
+            lines.append(
+                f"VS {vs_version}: {supported} supported as installed, "
+                f"{updatable} need another release, "
+                f"{len(releases) - supported - updatable} have none"
+            )
+        return "\n".join(lines)
+
+
+class CompatibilityWorker(QThread):
+    """Runs UpdaterCore.compatibility_matrix off the GUI thread."""
+
+    # Mods evaluated so far, total mods
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, core: UpdaterCore, vs_versions: list[str], parent=None):
+        super(CompatibilityWorker, self).__init__(parent)
+        self.core = core
+        self.vs_versions = vs_versions
+        self.cancel_event = threading.Event()
+        # Set when the run finishes, or error when it fails
+        self.matrix = None
+        self.error = None
 
-        # Looking through each mod folder
-        for folder in mods_path.iterdir():
-            # Check if item is a folder
-            if folder.is_dir():
-                # Looking for the mod zip file
-                for file in folder.iterdir():
-                    # If zip file
-                    if file.suffix.lower() == ".zip":
-                        mod_info = self.get_mod_info_from_zip(file)
-
-                        # Ensure mod_info is a dict and contains 'modid'
-                        if isinstance(mod_info, dict) and "modid" in mod_info:
-                            self.mods_data[mod_info["modid"]] = mod_info
-                        else:
-                            logging.warning(f"modinfo.json in {file} missing 'modid' key or is invalid. Skipping.")
-                        break
-
-    def get_latest_game_version(self):
-        """Returns the latest game version from the ModDB API."""
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def run(self):
         try:
-            with urllib.request.urlopen(f"{self.base_url}/gameversions") as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                    # ASSUMPTION: The last entry in the list is always the latest version
-                    return data["gameversions"][-1]["name"]
-                else:
-                    logging.critical(f"Error: HTTP {response.status}")
-                    return None
+            self.matrix = self.core.compatibility_matrix(
+                self.vs_versions, self.progress.emit, self.cancel_event
+            )
         except Exception as ex:
-            logging.critical(f"Error fetching latest game versions: {ex}")
-            raise
-
-    def get_mod_info_from_zip(self, zip_path: Path) -> dict:
-        """Returns modinfo.json from mod zip as a dictionary."""
-        mod_info = {}
+            logging.critical(f"Error building the compatibility matrix: {ex}")
+            self.error = str(ex) or type(ex).__name__
+
+
+class UpdatePlanWorker(QThread):
+    """Runs UpdaterCore.plan_updates off the GUI thread, as it may scan the mods."""
+
+    def __init__(
+        self,
+        core: UpdaterCore,
+        updates: list[Update],
+        available: list[Update],
+        parent=None,
+    ):
+        super(UpdatePlanWorker, self).__init__(parent)
+        self.core = core
+        self.updates = updates
+        self.available = list(available)
+        self.cancel_event = threading.Event()
+        # Set when the run finishes, or error when it fails
+        self.plan = None
+        self.error = None
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def run(self):
         try:
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                # Check if modinfo.json exists in the zip
-                if "modinfo.json" in zip_ref.namelist():
-                    # Read and parse the JSON file
-                    with zip_ref.open("modinfo.json") as json_file:
-                        # Use fix_json_string to ensure the JSON is valid
-                        json_str = json_file.read().decode("utf-8")
-                        json_str = fix_json_string(json_str)
-
-                        mod_info = json.loads(json_str)
-                        mod_info = {k.lower(): v for k, v in mod_info.items()}
-                        mod_info["path"] = zip_path
-
-                        json_file.close()
-                else:
-                    logging.critical(
-                        f"Warning: modinfo.json not found in {zip_path.name}"
-                    )
-
-                zip_ref.close()
-
-        except zipfile.BadZipFile:
-            logging.critical(f"Error: {zip_path.name} is not a valid zip file")
-        except json.JSONDecodeError:
-            logging.critical(
-                f"Error: Invalid JSON in modinfo.json from {zip_path.name}; could not update the mod. Report this to the mod author."
+            self.plan = self.core.plan_updates(
+                self.updates, self.available, self.cancel_event
             )
         except Exception as ex:
-            logging.critical(f"Error processing {zip_path.name}: {ex}")
+            logging.critical(f"Error planning mod updates: {ex}")
+            self.error = str(ex) or type(ex).__name__
+
+
+class UpdateCheckWorker(QThread):
+    """Runs UpdaterCore.check_for_updates off the GUI thread.
+
+    Each mod is checked as soon as its zip has been read, and every update is emitted as
+    soon as it is found.
+    """
+
+    # Mods checked so far, total mods
+    progress = pyqtSignal(int, int)
+    # Update records
+    update_found = pyqtSignal(object)
+
+    def __init__(self, core: UpdaterCore, parent=None):
+        super(UpdateCheckWorker, self).__init__(parent)
+        self.core = core
+        self.cancel_event = threading.Event()
+        # Set when the run fails
+        self.error = None
 
-        return mod_info
+    def cancel(self):
+        self.cancel_event.set()
 
-    def get_mod_info_from_api(self, mod_id: str) -> dict:
-        """Returns all data from ModDB page"""
-        data = {}
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def run(self):
+        # An exception escaping QThread.run would abort MO2
         try:
-            with urllib.request.urlopen(f"{self.base_url}/mod/{mod_id}") as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                else:
-                    logging.critical(f"Error: HTTP {response.status}")
+            self.core.check_for_updates(
+                self.update_found.emit, self.progress.emit, self.cancel_event
+            )
+        except Exception as ex:
+            logging.critical(f"Error checking for mod updates: {ex}")
+            self.error = str(ex) or type(ex).__name__
+
+
+class UpdateDownloadWorker(QThread):
+    """Runs UpdaterCore.update_mods off the GUI thread."""
+
+    # Mod id, bytes downloaded, total bytes (0 if unknown)
+    mod_progress = pyqtSignal(str, int, int)
+    # Mod id, path of the installed zip, error message (empty on success)
+    mod_finished = pyqtSignal(str, str, str)
+
+    def __init__(
+        self,
+        core: UpdaterCore,
+        updates: list[Update],
+        available: list[Update],
+        parent=None,
+    ):
+        super(UpdateDownloadWorker, self).__init__(parent)
+        self.core = core
+        self.updates = updates
+        # Every update found, for dependencies that a later update will meet
+        self.available = list(available)
+        self.cancel_event = threading.Event()
+        # Last shown progress step of each mod
+        self.progress_steps = {}
+        # Set when the run fails as a whole; failures of single mods are emitted
+        self.error = None
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        # An exception escaping QThread.run would abort MO2
+        try:
+            self.core.update_mods(
+                self.updates,
+                self.on_progress,
+                self.on_finished,
+                self.cancel_event,
+                self.available,
+            )
         except Exception as ex:
-            logging.critical(f"Error fetching mod info: {ex}")
-            raise
-        return data
+            logging.critical(f"Error updating mods: {ex}")
+            self.error = str(ex) or type(ex).__name__
+
+    def on_progress(self, mod_id: str, done: int, total: int):
+        # Only emit when the shown percentage (or MiB when size is unknown) changes
+        step = done * 100 // total if total else done // (1024 * 1024)
+        if step != self.progress_steps.get(mod_id):
+            self.progress_steps[mod_id] = step
+            self.mod_progress.emit(mod_id, done, total)
+
+    def on_finished(self, mod_id: str, zip_path: Path | None, error: str):
+        self.mod_finished.emit(mod_id, str(zip_path or ""), error)
 
 
 class RichTextDelegate(QtWidgets.QStyledItemDelegate):
+    # Laid-out documents kept for reuse, one per changelog text and column width
+    MAX_CACHED_DOCUMENTS = 512
+    # Theme-adjusted HTML kept for reuse, one per changelog text
+    MAX_CACHED_HTML = 2048
+
+    def __init__(self, parent=None):
+        super(RichTextDelegate, self).__init__(parent)
+        # LRU caches, both dropped whenever the palette changes
+        self.html_cache = OrderedDict()
+        self.document_cache = OrderedDict()
+        self.palette_key = None
+
     def is_dark_theme(self, option):
         """Detect if the current theme is dark by checking background color brightness."""
         bg_color = option.palette.color(QtGui.QPalette.ColorRole.Base)
@@ -458,18 +921,49 @@ class RichTextDelegate(QtWidgets.QStyledItemDelegate):
 
         return text
 
+    def get_document(self, option, index) -> QtGui.QTextDocument:
+        """Returns the laid-out document of an item, only building it once per width.
+
+        Items are keyed by their text, so rows with identical changelogs share a
+        document.
+        """
+        # Theme colors are baked into the cached HTML, so start over on palette changes
+        palette_key = option.palette.color(QtGui.QPalette.ColorRole.Base).rgba()
+        if palette_key != self.palette_key:
+            self.palette_key = palette_key
+            self.html_cache.clear()
+            self.document_cache.clear()
+
+        text = index.data()
+        width = option.rect.width()
+        doc = self.document_cache.get((text, width))
+        if doc is not None:
+            self.document_cache.move_to_end((text, width))
+            return doc
+
+        html = self.html_cache.get(text)
+        if html is None:
+            html = self.adjust_text_for_theme(text, self.is_dark_theme(option))
+            self.html_cache[text] = html
+            if len(self.html_cache) > self.MAX_CACHED_HTML:
+                self.html_cache.popitem(last=False)
+        else:
+            self.html_cache.move_to_end(text)
+
+        doc = QtGui.QTextDocument()
+        doc.setHtml(html)
+        doc.setTextWidth(width)
+        self.document_cache[(text, width)] = doc
+        if len(self.document_cache) > self.MAX_CACHED_DOCUMENTS:
+            self.document_cache.popitem(last=False)
+        return doc
+
     def paint(self, painter, option, index):
         # Only use rich text for child items (depth > 0)
         if index.parent().isValid():
-            text = index.data()
-            is_dark = self.is_dark_theme(option)
-            text = self.adjust_text_for_theme(text, is_dark)
-
-            doc = QtGui.QTextDocument()
-            doc.setHtml(text)
+            doc = self.get_document(option, index)
             painter.save()
             painter.translate(option.rect.topLeft())
-            doc.setTextWidth(option.rect.width())
             ctx = QtGui.QAbstractTextDocumentLayout.PaintContext()
             doc.documentLayout().draw(painter, ctx)
             painter.restore()
@@ -479,22 +973,184 @@ class RichTextDelegate(QtWidgets.QStyledItemDelegate):
 
     def sizeHint(self, option, index):
         if index.parent().isValid():
-            text = index.data()
-            is_dark = self.is_dark_theme(option)
-            text = self.adjust_text_for_theme(text, is_dark)
-
-            doc = QtGui.QTextDocument()
-            doc.setHtml(text)
-            doc.setTextWidth(option.rect.width())
+            doc = self.get_document(option, index)
             return QSize(int(doc.idealWidth()), int(doc.size().height()))
         else:
             return super().sizeHint(option, index)
 
 
+class ModsWatcher(QObject):
+    """Keeps a ModsFolderIndex live by watching the mods folder and every mod folder.
+
+    The index falls back to listing the whole mods folder on every scan if any folder
+    can't be watched.
+    """
+
+    def __init__(self, mods_path: Path, parent=None):
+        super(ModsWatcher, self).__init__(parent)
+        self.mods_path = mods_path
+        self.index = ModsFolderIndex(mods_path)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.watch_folders()
+
+    def watch_folders(self):
+        """Starts watching added mod folders and stops watching removed ones."""
+        try:
+            wanted = {str(self.mods_path)} | {
+                str(folder) for folder in self.mods_path.iterdir() if folder.is_dir()
+            }
+        except OSError as ex:
+            logging.warning(f"Could not list {self.mods_path}: {ex}")
+            self.index.live = False
+            return
+
+        watched = set(self.watcher.directories())
+        removed, added = watched - wanted, wanted - watched
+        if removed:
+            self.watcher.removePaths(list(removed))
+        failed = self.watcher.addPaths(list(added)) if added else []
+        if failed:
+            logging.warning(
+                f"Could not watch {len(failed)} mod folders, "
+                "listing all of them instead"
+            )
+            self.index.live = False
+        elif not self.index.live:
+            # Changes may have been missed while some folders weren't watched
+            self.index.invalidate()
+            self.index.live = True
+
+    def on_directory_changed(self, path: str):
+        # New folders are watched before the index is told, so a file added to one
+        # right after is either seen by the next scan or reported by the watcher
+        if Path(path) == self.mods_path:
+            self.watch_folders()
+        self.index.changed(Path(path))
+
+    def stop(self):
+        self.index.live = False
+        directories = self.watcher.directories()
+        if directories:
+            self.watcher.removePaths(directories)
+
+
+class BackgroundChecker(QObject):
+    """Checks for updates while MO2 runs, so the window opens with current results.
+
+    Runs once MO2's window is up and then every background_check_interval minutes, on
+    low-priority threads with at most BACKGROUND_MAX_CONNECTIONS requests in flight. The
+    results, mod index and Mod DB responses land in the same on-disk caches the window
+    reads. Paused while the window is open.
+    """
+
+    # Emitted when a check has stopped and its core is closed
+    stopped = pyqtSignal()
+
+    def __init__(self, organizer: mobase.IOrganizer, mods_index, parent=None):
+        super(BackgroundChecker, self).__init__(parent)
+        self.organizer = organizer
+        # Returns the live mods folder index, shared with the window
+        self.mods_index = mods_index
+        self.core = None
+        self.worker = None
+        self.paused = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.run)
+
+    def setting(self, key: str):
+        return self.organizer.pluginSetting(PLUGIN_NAME, key)
+
+    def enabled(self) -> bool:
+        return bool(self.setting("enabled")) and bool(self.setting("background_check"))
+
+    def schedule(self):
+        """Plans the next run after the configured interval, if any."""
+        self.timer.stop()
+        interval = float(self.setting("background_check_interval") or 0)
+        if self.enabled() and not self.paused and interval > 0:
+            self.timer.start(int(interval * 60 * 1000))
+
+    def run(self):
+        if self.worker is not None or self.paused or not self.enabled():
+            return
+        try:
+            self.core = create_core(
+                self.organizer, self.mods_index(), BACKGROUND_MAX_CONNECTIONS
+            )
+        except Exception as ex:
+            logging.warning(f"Could not start background update check: {ex}")
+            self.schedule()
+            return
+        logging.debug("Checking for mod updates in the background")
+        self.core.thread_initializer = lower_thread_priority
+        self.worker = UpdateCheckWorker(self.core, self)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start(QThread.Priority.LowestPriority)
+
+    def on_finished(self):
+        # Already cleaned up if shutdown waited for the run
+        if self.worker is None:
+            return
+        if self.worker.error is not None:
+            logging.warning(f"Background update check failed: {self.worker.error}")
+        elif not self.worker.is_cancelled():
+            updates = self.core.last_updates()
+            logging.info(f"Background check found {len(updates)} mod updates")
+        self.cleanup()
+        self.schedule()
+
+    def cancel(self):
+        """Cancels a running check; results so far are kept.
+
+        The check stops on its own shortly after and is cleaned up in on_finished, so
+        the GUI thread never blocks on it.
+        """
+        self.timer.stop()
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def wait(self):
+        """Blocks until a cancelled check has stopped; only for shutdown."""
+        if self.worker is not None:
+            self.worker.wait()
+            self.cleanup()
+
+    def is_running(self) -> bool:
+        """Returns whether a check, possibly cancelled, is still running."""
+        return self.worker is not None
+
+    def cleanup(self):
+        self.worker = None
+        if self.core is not None:
+            self.core.close()
+            self.core = None
+        self.stopped.emit()
+
+    def pause(self):
+        self.paused = True
+        self.cancel()
+
+    def resume(self):
+        self.paused = False
+        self.schedule()
+
+    def stop(self):
+        """Stops for good, e.g. when MO2 shuts down."""
+        self.paused = True
+        self.cancel()
+
+
 class VSModUpdaterPlugin(mobase.IPluginTool):
 
     def __init__(self):
         self.__window = None
+        # Live index of the mods folder, kept between openings of the window
+        self.__watcher = None
+        self.__background = None
+        # Closed windows whose cancelled workers are still stopping
+        self.__stopping_windows = set()
         # self.organizer = None
         self.__parentWidget = None
 
@@ -502,10 +1158,38 @@ class VSModUpdaterPlugin(mobase.IPluginTool):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         self.organizer = organizer
+        self.__background = BackgroundChecker(organizer, self.mods_index)
+        # The first check waits for MO2's window, so it doesn't slow down startup
+        organizer.onUserInterfaceInitialized(lambda _: self.__background.run())
+        organizer.onPluginSettingChanged(self.on_setting_changed)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.shutdown)
         return True
 
+    def on_setting_changed(self, plugin: str, key: str, old, new):
+        if plugin == PLUGIN_NAME and key.startswith("background_check"):
+            self.__background.schedule()
+
+    def shutdown(self):
+        # The only place that waits for workers, as MO2 is exiting anyway
+        self.__background.stop()
+        self.__background.wait()
+        for window in list(self.__stopping_windows):
+            window.wait_for_workers()
+        self.__stopping_windows.clear()
+        if self.__watcher is not None:
+            self.__watcher.stop()
+
+    def mods_index(self) -> ModsFolderIndex:
+        """Returns the live index of MO2's mods folder, watching it on first use."""
+        mods_path = Path(self.organizer.modsPath())
+        if self.__watcher is None or self.__watcher.mods_path != mods_path:
+            if self.__watcher is not None:
+                self.__watcher.stop()
+            self.__watcher = ModsWatcher(mods_path)
+        return self.__watcher.index
+
     def name(self) -> str:
-        return "VS Mod Updater"
+        return PLUGIN_NAME
 
     def author(self):
         return "mosharky"
@@ -517,14 +1201,89 @@ class VSModUpdaterPlugin(mobase.IPluginTool):
         return mobase.VersionInfo(1, 0, 2)
 
     def settings(self) -> List[mobase.PluginSetting]:
-        return [mobase.PluginSetting("enabled", "Enable this plugin", True)]
+        return [
+            mobase.PluginSetting("enabled", "Enable this plugin", True),
+            mobase.PluginSetting(
+                "api_cache_ttl",
+                "Minutes to reuse cached Mod DB responses before revalidating them",
+                DEFAULT_CACHE_TTL_MINUTES,
+            ),
+            mobase.PluginSetting(
+                "api_cache_size",
+                "Maximum size of the Mod DB response cache in MB",
+                DEFAULT_CACHE_SIZE_MB,
+            ),
+            mobase.PluginSetting(
+                "archive_cache_size",
+                "Maximum size in MB of the downloaded and replaced mod zips kept for "
+                "reinstalls and rollbacks",
+                DEFAULT_ARCHIVE_CACHE_SIZE_MB,
+            ),
+            mobase.PluginSetting(
+                "min_connections",
+                "Requests to Mod DB kept in flight even when it is slow or throttling",
+                DEFAULT_MIN_CONCURRENCY,
+            ),
+            mobase.PluginSetting(
+                "max_connections",
+                "Most requests to Mod DB in flight at once, for checks and downloads",
+                DEFAULT_MAX_CONCURRENCY,
+            ),
+            mobase.PluginSetting(
+                "background_check",
+                "Check for updates in the background once MO2 has started",
+                False,
+            ),
+            mobase.PluginSetting(
+                "background_check_interval",
+                "Minutes between background checks while MO2 runs, 0 to only check at "
+                "startup",
+                DEFAULT_BACKGROUND_INTERVAL_MINUTES,
+            ),
+            mobase.PluginSetting(
+                "diagnostics",
+                "Show timings of checks and downloads, and save them to "
+                "diagnostics.json",
+                False,
+            ),
+        ]
 
     def display(self):
-        self.__window = PluginWindow(self.organizer)
-        self.__window.setWindowTitle(self.name())
-        self.__window.exec()
-
-        self.organizer.refresh()
+        index = self.mods_index()
+        changes = index.changes
+        # The window checks by itself; results of a cancelled background run are kept
+        self.__background.pause()
+
+        # The window waits for a cancelled background check, as both write the caches
+        window = PluginWindow(self.organizer, index, self.__background)
+        self.__window = window
+        window.setWindowTitle(self.name())
+        try:
+            window.exec()
+        finally:
+            self.__background.resume()
+
+        if window.stopping_workers:
+            # Kept alive until its workers stop, as a download may still finish
+            self.__stopping_windows.add(window)
+            window.stopped.connect(
+                lambda: self.on_window_stopped(window, index, changes)
+            )
+        else:
+            self.refresh_if_changed(window, index, changes)
+
+    def on_window_stopped(
+        self, window: PluginWindow, index: ModsFolderIndex, changes: int
+    ):
+        self.__stopping_windows.discard(window)
+        self.refresh_if_changed(window, index, changes)
+
+    def refresh_if_changed(
+        self, window: PluginWindow, index: ModsFolderIndex, changes: int
+    ):
+        # Only refresh MO2 if files in the mods folder changed while the window was open
+        if window.mods_changed or index.changes != changes:
+            self.organizer.refresh()
 
     def displayName(self) -> str:
         return self.name()